@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+import importlib.util
 import subprocess
 import sys
 from pathlib import Path
@@ -49,6 +50,13 @@ def _isort_args(*, fix: bool) -> list[str]:
     return args
 
 
+def _pytest_args() -> list[str]:
+    """Spread tests across CPUs, one file per worker, when pytest-xdist is present."""
+    if importlib.util.find_spec("xdist") is None:
+        return _python_m("pytest")
+    return _python_m("pytest", "-n", "auto", "--dist=loadfile")
+
+
 def main() -> None:
     """Execute formatting, linting, security, and test checks."""
     parser = argparse.ArgumentParser(description="Run dav2mkv quality checks.")
@@ -81,7 +89,7 @@ def main() -> None:
             "bandit",
             _python_m("bandit", "-r", "src/dav2mkv", "-c", "pyproject.toml", "-q"),
         ),
-        ("pytest", _python_m("pytest")),
+        ("pytest", _pytest_args()),
     ]
 
     for name, step_args in steps:
@@ -13,11 +13,13 @@ from dav2mkv.exceptions import (
     FFmpegNotFoundError,
     VideoProcessingError,
 )
+from dav2mkv.types import ConversionOptions
 
 __version__ = get_version()
 
 __all__ = [
     "BatchConverter",
+    "ConversionOptions",
     "DAVConverterError",
     "FFmpegNotFoundError",
     "VideoConverter",
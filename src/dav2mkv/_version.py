@@ -1,7 +1,6 @@
 """Package version resolution."""
 
 import sys
-from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 from typing import cast
 
@@ -61,6 +60,13 @@ def get_version() -> str:
         pyproject_version = _fallback_version()
         if pyproject_version != "unknown":
             return pyproject_version
+
+    # importlib.metadata is slow to import; only installed copies need it.
+    from importlib.metadata import (  # pylint: disable=import-outside-toplevel
+        PackageNotFoundError,
+        version,
+    )
+
     try:
         return version(_PACKAGE_NAME)
     except PackageNotFoundError:
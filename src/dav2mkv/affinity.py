@@ -0,0 +1,83 @@
+"""Pinning FFmpeg to CPUs through the mask of the thread that starts it."""
+
+import logging
+import os
+import sys
+import weakref
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop, Lock
+
+# One lock per event loop, since the loop's thread owns the mask being changed.
+_LOOP_LOCKS: "weakref.WeakKeyDictionary[AbstractEventLoop, Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _pin_calling_thread(
+    cpus: tuple[int, ...], logger: logging.Logger
+) -> set[int] | None:
+    """
+    Restrict the calling thread to the given CPUs.
+
+    Returns:
+        The thread's previous CPU mask, or None if it was not changed
+    """
+    if not cpus:
+        return None
+    if sys.platform != "linux":
+        logger.debug("CPU pinning is not supported on %s", sys.platform)
+        return None
+    try:
+        original = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, cpus)
+    except OSError as exc:
+        logger.warning("Could not pin FFmpeg to CPUs %s: %s", cpus, exc)
+        return None
+    return original
+
+
+@contextmanager
+def pinned_calling_thread(
+    cpus: tuple[int, ...], logger: logging.Logger
+) -> Iterator[None]:
+    """
+    Pin the calling thread to cpus while a child process is started.
+
+    On Linux, sched_setaffinity(0) changes only the calling thread, and a
+    child process inherits that mask before it runs, so FFmpeg and every
+    thread it creates stay on those CPUs. The previous mask is restored on
+    exit. An empty cpus, or another platform, leaves the thread unpinned.
+    """
+    original_cpus = _pin_calling_thread(cpus, logger)
+    try:
+        yield
+    finally:
+        if original_cpus is not None:
+            os.sched_setaffinity(0, original_cpus)
+
+
+@asynccontextmanager
+async def pinned_event_loop_thread(
+    cpus: tuple[int, ...], logger: logging.Logger
+) -> AsyncIterator[None]:
+    """
+    Async counterpart of pinned_calling_thread for the event-loop thread.
+
+    Starting an asyncio subprocess awaits, so other coroutines run while the
+    loop thread is pinned. Pinned spawns on one loop therefore take turns;
+    otherwise one could save another's pinned mask as the one to restore.
+    """
+    if not cpus:
+        yield
+        return
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    loop = asyncio.get_running_loop()
+    lock = _LOOP_LOCKS.setdefault(loop, asyncio.Lock())
+    async with lock:
+        with pinned_calling_thread(cpus, logger):
+            yield
@@ -1,44 +1,164 @@
 """Batch directory conversion with parallel processing."""
 
-import multiprocessing
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+import logging
+import os
+import queue
+import time
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    BrokenExecutor,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from dataclasses import replace
 from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar, cast
 
 from dav2mkv.converter import VideoConverter
-from dav2mkv.types import BatchResults
+from dav2mkv.log_config import forward_worker_logs, setup_worker_logging
+from dav2mkv.types import BatchResults, ConversionOptions
+
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+
+_ResultT = TypeVar("_ResultT")
+
+_PROCESS_STATE: dict[str, VideoConverter] = {}
+
+VIDEO_EXTENSIONS = frozenset(
+    {
+        ".dav",
+        ".avi",
+        ".mp4",
+        ".mkv",
+        ".mov",
+        ".wmv",
+        ".flv",
+        ".webm",
+        ".m4v",
+        ".3gp",
+        ".3g2",
+        ".asf",
+        ".rm",
+        ".rmvb",
+        ".vob",
+        ".ts",
+    }
+)
+
+# Stream copy is disk-bound: beyond a few concurrent remuxes, extra workers
+# only add seeks and contention.
+_COPY_MODE_MAX_WORKERS = 4
+
+
+def available_cpu_ids() -> tuple[int, ...]:
+    """
+    Return the IDs of the CPUs this process may run on.
+
+    Uses the scheduler affinity mask where the platform provides one, so
+    pinned or container-restricted processes do not size their worker pools
+    from the host CPU count.
+    """
+    try:
+        return tuple(sorted(os.sched_getaffinity(0)))
+    except AttributeError:
+        return tuple(range(os.cpu_count() or 1))
+
+
+def available_cpus() -> int:
+    """Return the number of CPUs this process may run on."""
+    return max(1, len(available_cpu_ids()))
+
+
+def _partition_cpus(cpus: tuple[int, ...], parts: int) -> list[tuple[int, ...]]:
+    """Split CPU IDs into contiguous groups, one per concurrent worker."""
+    parts = max(1, parts)
+    if len(cpus) < parts:
+        return [(cpus[index % len(cpus)],) for index in range(parts)]
+    return [
+        cpus[index * len(cpus) // parts : (index + 1) * len(cpus) // parts]
+        for index in range(parts)
+    ]
+
+
+def _default_max_workers() -> int:
+    """Default number of concurrent stream-copy conversions."""
+    return min(_COPY_MODE_MAX_WORKERS, available_cpus())
+
+
+def _ffmpeg_threads_per_invocation(n_workers: int) -> int:
+    """Split the available CPUs evenly between concurrent FFmpeg processes."""
+    n_workers = max(1, n_workers)
+    return max(1, available_cpus() // n_workers)
+
+
+def _init_process_worker(
+    log_level: str, log_records: "Queue[logging.LogRecord]"
+) -> None:
+    """Send a spawned worker's log records to the parent process."""
+    setup_worker_logging(log_level, log_records)
+
+
+def _worker_convert(
+    input_file: Path,
+    output_file: Path,
+    container: str,
+    overwrite: bool,
+    options: ConversionOptions,
+) -> tuple[bool, float]:
+    """Convert one file inside a worker process and report (success, elapsed)."""
+    converter = _PROCESS_STATE.get("converter")
+    if converter is None:
+        converter = VideoConverter()
+        _PROCESS_STATE["converter"] = converter
+
+    start_time = time.monotonic()
+    success = converter.convert_video(
+        input_file, output_file, container, overwrite, options
+    )
+    return success, time.monotonic() - start_time
 
 
 class BatchConverter:
     """Batch video converter with parallel processing support."""
 
     def __init__(
-        self, converter: VideoConverter, max_workers: int | None = None
+        self,
+        converter: VideoConverter,
+        max_workers: int | None = None,
+        prefetch_info: bool = True,
+        options: ConversionOptions | None = None,
+        use_processes: bool = False,
     ) -> None:
         self.converter = converter
         self.logger = converter.logger
-        self.max_workers = max_workers or max(1, multiprocessing.cpu_count() - 1)
-
-        self.video_extensions = {
-            ".dav",
-            ".avi",
-            ".mp4",
-            ".mkv",
-            ".mov",
-            ".wmv",
-            ".flv",
-            ".webm",
-            ".m4v",
-            ".3gp",
-            ".3g2",
-            ".asf",
-            ".rm",
-            ".rmvb",
-            ".vob",
-            ".ts",
-        }
+        self.max_workers = max_workers or _default_max_workers()
+        self.prefetch_info = prefetch_info
+        options = options or ConversionOptions()
+        self.options = replace(
+            options,
+            threads=options.threads or _ffmpeg_threads_per_invocation(self.max_workers),
+            skip_mkdir=True,
+            skip_input_check=True,
+        )
+        self.use_processes = use_processes
+
+    @property
+    def video_extensions(self) -> frozenset[str]:
+        """Lowercase file suffixes, with the dot, treated as video files."""
+        return VIDEO_EXTENSIONS
+
+    @property
+    def per_invocation_threads(self) -> int | None:
+        """FFmpeg thread count passed to each conversion."""
+        return self.options.threads
 
     def find_video_files(
-        self, directory: str | Path, recursive: bool = False
+        self, directory: str | Path, recursive: bool = False, sort: bool = True
     ) -> list[Path]:
         """
         Find all video files in a directory.
@@ -46,45 +166,124 @@ class BatchConverter:
         Args:
             directory: Directory to search
             recursive: Whether to search recursively
+            sort: Return paths sorted; when False they come back in discovery
+                order, which depends on the filesystem and on which
+                subdirectory listing finishes first
 
         Returns:
             List of video file paths
         """
         directory_path = Path(directory)
-
-        if not directory_path.exists():
-            self.logger.error("Directory does not exist: %s", directory_path)
-            return []
-
-        if not directory_path.is_dir():
-            self.logger.error("Path is not a directory: %s", directory_path)
+        if not self._is_scannable_directory(directory_path):
             return []
 
         video_files: list[Path] = []
+        log_each_file = self.logger.isEnabledFor(logging.DEBUG)
 
         try:
-            if recursive:
-                files = directory_path.rglob("*")
-            else:
-                files = directory_path.iterdir()
-
-            for file_path in files:
-                if (
-                    file_path.is_file()
-                    and file_path.suffix.lower() in self.video_extensions
-                ):
-                    video_files.append(file_path)
+            for file_path in self._scan_directory(str(directory_path), recursive):
+                video_files.append(file_path)
+                if log_each_file:
                     self.logger.debug("Found video file: %s", file_path)
 
             self.logger.info(
                 "Found %s video files in %s", len(video_files), directory_path
             )
-            return sorted(video_files)
+            return sorted(video_files) if sort else video_files
 
         except OSError as exc:
             self.logger.error("Error scanning directory %s: %s", directory_path, exc)
             return []
 
+    def _is_scannable_directory(self, directory_path: Path) -> bool:
+        """Check that a directory exists, logging why it cannot be scanned."""
+        if not directory_path.exists():
+            self.logger.error("Directory does not exist: %s", directory_path)
+            return False
+
+        if not directory_path.is_dir():
+            self.logger.error("Path is not a directory: %s", directory_path)
+            return False
+
+        return True
+
+    def _scan_directory(self, directory: str, recursive: bool) -> list[Path]:
+        """
+        Collect video files below a directory using os.scandir.
+
+        The top directory is listed first so that errors reading it reach the
+        caller. Subdirectories are then listed concurrently on up to
+        max_workers threads, overlapping directory reads on slow or network
+        filesystems; unreadable ones are skipped with a warning.
+        """
+        video_files, subdirectories = self._scan_one_directory(directory, recursive)
+        if not subdirectories:
+            return video_files
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {
+                executor.submit(self._scan_subdirectory, subdirectory)
+                for subdirectory in subdirectories
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    found, subdirectories = future.result()
+                    video_files.extend(found)
+                    pending.update(
+                        executor.submit(self._scan_subdirectory, subdirectory)
+                        for subdirectory in subdirectories
+                    )
+        return video_files
+
+    def _scan_subdirectory(self, directory: str) -> tuple[list[Path], list[str]]:
+        """
+        List one subdirectory, treating one that cannot be read as empty.
+
+        Besides permission errors this covers directories removed or replaced
+        mid-walk and entries that stop resolving, none of which should abort
+        the rest of the scan.
+        """
+        try:
+            return self._scan_one_directory(directory, True)
+        except OSError as exc:
+            self.logger.warning("Skipping unreadable directory %s: %s", directory, exc)
+            return [], []
+
+    def _scan_one_directory(
+        self, directory: str, recursive: bool
+    ) -> tuple[list[Path], list[str]]:
+        """
+        List one directory's video files and, if recursive, its subdirectories.
+
+        Directory entries carry their file type from the directory listing, so
+        only symlinks need an extra stat. Names are filtered on their suffix
+        before the file check, and suffixes longer than any known extension
+        are rejected without lowercasing. As with Path.suffix, a leading dot
+        does not start a suffix, so dotfiles such as ".dav" are not matched.
+        Symlinked directories are not followed to avoid walking cycles.
+        """
+        extensions = self.video_extensions
+        longest_suffix = max(map(len, extensions), default=0)
+        video_files: list[Path] = []
+        subdirectories: list[str] = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        subdirectories.append(entry.path)
+                    continue
+                name = entry.name
+                dot = name.rfind(".")
+                if (
+                    dot > 0
+                    and len(name) - dot <= longest_suffix
+                    and name[dot:].lower() in extensions
+                    and entry.is_file()
+                ):
+                    video_files.append(Path(entry.path))
+        return video_files, subdirectories
+
     def _output_path_for_file(
         self,
         video_file: Path,
@@ -92,18 +291,46 @@ class BatchConverter:
         output_dir: Path,
         container: str,
     ) -> Path:
-        """Compute the output path for a video file in batch mode."""
-        if output_dir != input_dir:
+        """
+        Compute the output path for a video file in batch mode.
+
+        Discovered paths always start with the input directory's string form,
+        so the output path is built by string slicing and one Path
+        construction instead of relative_to, with_suffix and joining.
+        """
+        video_path = str(video_file)
+        if output_dir == input_dir:
+            return Path(f"{os.path.splitext(video_path)[0]}.{container}")
+
+        input_prefix = os.path.join(input_dir, "")
+        if not video_path.startswith(input_prefix):
             relative_path = video_file.relative_to(input_dir)
             return output_dir / relative_path.with_suffix(f".{container}")
-        return video_file.with_suffix(f".{container}")
+        relative_stem = os.path.splitext(video_path[len(input_prefix) :])[0]
+        return Path(output_dir, f"{relative_stem}.{container}")
+
+    def _create_output_dirs(self, output_files: Iterable[Path]) -> None:
+        """Create each distinct output directory once before dispatching jobs."""
+        for parent in {output_file.parent for output_file in output_files}:
+            try:
+                parent.mkdir(parents=True, exist_ok=True)
+            except OSError as exc:
+                self.logger.error("Cannot create output directory %s: %s", parent, exc)
 
     def _collect_batch_results(
         self,
-        future_to_file: dict[Future[bool], Path],
+        executor: Executor,
+        future_to_file: dict[Future[_ResultT], Path],
         total_files: int,
+        succeeded: Callable[[_ResultT], bool],
     ) -> BatchResults:
-        """Collect results from submitted batch conversion futures."""
+        """
+        Collect results from submitted batch conversion futures.
+
+        On KeyboardInterrupt, queued conversions are cancelled and running
+        FFmpeg processes terminated before the interrupt is re-raised, so the
+        executor shutdown does not wait for the rest of the batch.
+        """
         results: BatchResults = {
             "total": total_files,
             "successful": 0,
@@ -111,30 +338,169 @@ class BatchConverter:
         }
         completed = 0
 
-        for future in as_completed(future_to_file):
-            video_file = future_to_file[future]
-            completed += 1
+        try:
+            for future in as_completed(future_to_file):
+                video_file = future_to_file[future]
+                completed += 1
 
-            try:
-                success = future.result(timeout=3700)
-                if success:
-                    results["successful"] += 1
-                else:
+                try:
+                    self._tally_result(results, succeeded(future.result()), completed)
+                except (OSError, BrokenExecutor) as exc:
                     results["failed"] += 1
+                    self.logger.error(
+                        "Conversion exception for %s: %s", video_file, exc
+                    )
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            stopped = self.converter.terminate_active_processes()
+            self.logger.warning(
+                "Batch interrupted: cancelled queued conversions, stopped %s "
+                "running FFmpeg processes",
+                stopped,
+            )
+            raise
+
+        return results
+
+    def _tally_result(
+        self, results: BatchResults, success: bool, completed: int
+    ) -> None:
+        """Count one finished conversion and log overall progress."""
+        if success:
+            results["successful"] += 1
+        else:
+            results["failed"] += 1
+
+        self.logger.info(
+            "Progress: %s/%s files processed (%s successful, %s failed)",
+            completed,
+            results["total"],
+            results["successful"],
+            results["failed"],
+        )
+
+    def _slot_options(self) -> list[ConversionOptions]:
+        """
+        Conversion options for each of the max_workers concurrent slots.
+
+        When the options carry a CPU affinity, it is split so that concurrent
+        FFmpeg processes run on disjoint CPUs.
+        """
+        if not self.options.cpu_affinity:
+            return [self.options] * self.max_workers
+        return [
+            replace(self.options, cpu_affinity=cpus)
+            for cpus in _partition_cpus(self.options.cpu_affinity, self.max_workers)
+        ]
+
+    def _convert_in_slot(
+        self,
+        slots: "queue.SimpleQueue[ConversionOptions]",
+        video_file: Path,
+        output_file: Path,
+        container: str,
+        overwrite: bool,
+    ) -> bool:
+        """Convert one file using a free slot's options, then free the slot."""
+        options = slots.get()
+        try:
+            return self.converter.convert_video(
+                video_file, output_file, container, overwrite, options
+            )
+        finally:
+            slots.put(options)
+
+    def _run_in_threads(
+        self, jobs: list[tuple[Path, Path]], container: str, overwrite: bool
+    ) -> BatchResults:
+        """Convert jobs with worker threads sharing this batch's converter."""
+        slots: queue.SimpleQueue[ConversionOptions] = queue.SimpleQueue()
+        for options in self._slot_options():
+            slots.put(options)
 
-                self.logger.info(
-                    "Progress: %s/%s files processed (%s successful, %s failed)",
-                    completed,
-                    total_files,
-                    results["successful"],
-                    results["failed"],
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            future_to_file: dict[Future[bool], Path] = {}
+
+            for video_file, output_file in jobs:
+                future = executor.submit(
+                    self._convert_in_slot,
+                    slots,
+                    video_file,
+                    output_file,
+                    container,
+                    overwrite,
                 )
+                future_to_file[future] = video_file
 
-            except OSError as exc:
-                results["failed"] += 1
-                self.logger.error("Conversion exception for %s: %s", video_file, exc)
+            return self._collect_batch_results(
+                executor, future_to_file, len(jobs), bool
+            )
 
-        return results
+    def _record_process_outcome(self, outcome: tuple[bool, float]) -> bool:
+        """Fold a worker process result into the parent converter's stats."""
+        success, processing_time = outcome
+        self.converter.record_conversion(success, processing_time)
+        return success
+
+    def _run_in_processes(
+        self, jobs: list[tuple[Path, Path]], container: str, overwrite: bool
+    ) -> BatchResults:
+        """
+        Convert jobs in spawned worker processes.
+
+        Each worker builds its own VideoConverter, so prefetched probe info is
+        not shared and statistics are aggregated here from the returned
+        (success, elapsed) tuples. Workers send their log records back over a
+        queue and they are replayed through this process's handlers, so they
+        reach the console and log file. CPU affinity groups are assigned to
+        jobs round-robin, which keeps concurrent jobs apart only approximately.
+        """
+        import multiprocessing  # pylint: disable=import-outside-toplevel
+        from concurrent.futures import (  # pylint: disable=import-outside-toplevel
+            ProcessPoolExecutor,
+        )
+
+        context = multiprocessing.get_context("spawn")
+        log_records: Queue[logging.LogRecord] = context.Queue()
+        log_level = cast(str, logging.getLevelName(self.logger.getEffectiveLevel()))
+        log_listener = forward_worker_logs(log_records)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=context,
+                initializer=_init_process_worker,
+                initargs=(log_level, log_records),
+            ) as executor:
+                future_to_file = self._submit_to_processes(
+                    executor, jobs, container, overwrite
+                )
+                return self._collect_batch_results(
+                    executor, future_to_file, len(jobs), self._record_process_outcome
+                )
+        finally:
+            log_listener.stop()
+
+    def _submit_to_processes(
+        self,
+        executor: Executor,
+        jobs: list[tuple[Path, Path]],
+        container: str,
+        overwrite: bool,
+    ) -> dict[Future[tuple[bool, float]], Path]:
+        """Submit every job to a process pool, cycling through slot options."""
+        slot_options = self._slot_options()
+        future_to_file: dict[Future[tuple[bool, float]], Path] = {}
+        for index, (video_file, output_file) in enumerate(jobs):
+            future = executor.submit(
+                _worker_convert,
+                video_file,
+                output_file,
+                container,
+                overwrite,
+                slot_options[index % len(slot_options)],
+            )
+            future_to_file[future] = video_file
+        return future_to_file
 
     def convert_directory(
         self,
@@ -157,24 +523,210 @@ class BatchConverter:
         Returns:
             Dictionary with conversion statistics
         """
-        input_path = Path(input_dir)
+        jobs = self._prepare_jobs(input_dir, output_dir, container, recursive)
+        if not jobs:
+            return {"total": 0, "successful": 0, "failed": 0}
 
-        if output_dir:
-            resolved_output_dir = Path(output_dir)
-            resolved_output_dir.mkdir(parents=True, exist_ok=True)
+        if self.use_processes:
+            results = self._run_in_processes(jobs, container, overwrite)
         else:
-            resolved_output_dir = input_path
+            results = self._run_with_prefetch(jobs, container, overwrite)
+
+        self.logger.info("Batch conversion completed: %s", results)
+        return results
+
+    def _run_with_prefetch(
+        self, jobs: list[tuple[Path, Path]], container: str, overwrite: bool
+    ) -> BatchResults:
+        """Convert jobs in threads while a second pool probes the files ahead."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as probe_pool:
+            prefetched = self._prefetch_video_info(
+                jobs, container, overwrite, probe_pool
+            )
+            try:
+                return self._run_in_threads(jobs, container, overwrite)
+            finally:
+                self.converter.discard_video_info(prefetched)
+
+    def _prefetch_video_info(
+        self,
+        jobs: list[tuple[Path, Path]],
+        container: str,
+        overwrite: bool,
+        probe_pool: Executor,
+    ) -> list[Path]:
+        """
+        Probe the inputs that will run FFmpeg alongside the conversions.
+
+        Probes are queued in job order on their own pool, so later files are
+        probed while earlier ones convert. Jobs settled without FFmpeg
+        (same-container copies and outputs kept because overwrite is off)
+        never read the cache, so they are skipped.
+
+        Returns:
+            The probed input paths, so unused cache entries can be discarded
+        """
+        if not self.prefetch_info or self.options.skip_probe:
+            return []
+        to_probe = [
+            video_file
+            for video_file, output_file in jobs
+            if self.converter.will_run_ffmpeg(
+                video_file, output_file, container, overwrite, self.options
+            )
+        ]
+        return self.converter.prefetch_video_info(to_probe, probe_pool)
+
+    async def convert_directory_async(
+        self,
+        input_dir: str | Path,
+        output_dir: str | Path | None = None,
+        container: str = "mkv",
+        recursive: bool = False,
+        overwrite: bool = True,
+    ) -> BatchResults:
+        """
+        Convert all video files in a directory from an asyncio event loop.
+
+        FFmpeg and ffprobe run as asyncio subprocesses, so no thread is parked
+        per in-flight conversion. Discovery and conversion are pipelined:
+        directories are listed in a worker thread and each file found is
+        queued for one of max_workers consumers, so conversions start before
+        the walk finishes. Progress totals count the files found so far.
+        OS errors from scanning or from one conversion are logged and counted
+        like in convert_directory rather than cancelling the whole batch.
+        Takes the same arguments as convert_directory; prefetch and
+        process-pool settings do not apply.
+
+        Returns:
+            Dictionary with conversion statistics
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        batch_dirs = self._start_batch(input_dir, output_dir, container)
+        jobs: asyncio.Queue[tuple[Path, Path] | None] = asyncio.Queue(
+            maxsize=2 * self.max_workers
+        )
+        results: BatchResults = {"total": 0, "successful": 0, "failed": 0}
+        completed = 0
+
+        async def produce(input_path: Path, output_root: Path) -> None:
+            created_dirs: set[Path] = set()
+            try:
+                async for video_file in self._iter_video_files_async(
+                    input_path, recursive
+                ):
+                    output_file = self._output_path_for_file(
+                        video_file, input_path, output_root, container
+                    )
+                    if output_file.parent not in created_dirs:
+                        self._create_output_dirs((output_file,))
+                        created_dirs.add(output_file.parent)
+                    results["total"] += 1
+                    await jobs.put((video_file, output_file))
+            except OSError as exc:
+                self.logger.error("Error scanning directory %s: %s", input_path, exc)
+            for _ in range(self.max_workers):
+                await jobs.put(None)
+
+        async def consume(options: ConversionOptions) -> None:
+            nonlocal completed
+            while (job := await jobs.get()) is not None:
+                try:
+                    success = await self.converter.convert_video_async(
+                        job[0], job[1], container, overwrite, options
+                    )
+                except OSError as exc:
+                    self.logger.error("Conversion exception for %s: %s", job[0], exc)
+                    success = False
+                completed += 1
+                self._tally_result(results, success, completed)
+
+        async with asyncio.TaskGroup() as tasks:
+            tasks.create_task(produce(*batch_dirs))
+            for options in self._slot_options():
+                tasks.create_task(consume(options))
+
+        if not results["total"]:
+            self.logger.warning("No video files found to convert")
+            return results
+
+        self.logger.info("Batch conversion completed: %s", results)
+        return results
+
+    async def _iter_video_files_async(
+        self, directory_path: Path, recursive: bool
+    ) -> AsyncIterator[Path]:
+        """Yield video files directory by directory, listing each in a thread."""
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        if not self._is_scannable_directory(directory_path):
+            return
+
+        loop = asyncio.get_running_loop()
+        try:
+            listing = await loop.run_in_executor(
+                None, self._scan_one_directory, str(directory_path), recursive
+            )
+        except OSError as exc:
+            self.logger.error("Error scanning directory %s: %s", directory_path, exc)
+            return
+
+        pending: list[str] = []
+        while True:
+            video_files, subdirectories = listing
+            pending.extend(subdirectories)
+            for video_file in sorted(video_files):
+                yield video_file
+            if not pending:
+                return
+            listing = await loop.run_in_executor(
+                None, self._scan_subdirectory, pending.pop()
+            )
+
+    def _start_batch(
+        self, input_dir: str | Path, output_dir: str | Path | None, container: str
+    ) -> tuple[Path, Path]:
+        """
+        Resolve the output root and log the batch settings.
+
+        The output root is not created here; output directories are made as
+        jobs are prepared, so a batch with nothing to convert leaves no trace.
+        A cancellation left by an interrupted earlier batch is cleared, so
+        every entry point can start FFmpeg again.
+        """
+        self.converter.reset_cancellation()
+        input_path = Path(input_dir)
+        resolved_output_dir = Path(output_dir) if output_dir else input_path
 
         self.logger.info(
             "Starting batch conversion: %s -> %s", input_path, resolved_output_dir
         )
-        self.logger.info("Container: %s, Workers: %s", container, self.max_workers)
+        self.logger.info(
+            "Container: %s, Workers: %s, FFmpeg threads per worker: %s",
+            container,
+            self.max_workers,
+            self.per_invocation_threads,
+        )
+        return input_path, resolved_output_dir
 
-        video_files = self.find_video_files(input_path, recursive=recursive)
+    def _prepare_jobs(
+        self,
+        input_dir: str | Path,
+        output_dir: str | Path | None,
+        container: str,
+        recursive: bool,
+    ) -> list[tuple[Path, Path]]:
+        """Find the files to convert, pair them with output paths and make dirs."""
+        input_path, resolved_output_dir = self._start_batch(
+            input_dir, output_dir, container
+        )
+        # Workers finish in any order, so discovery order is as good as sorted.
+        video_files = self.find_video_files(input_path, recursive=recursive, sort=False)
 
         if not video_files:
             self.logger.warning("No video files found to convert")
-            return {"total": 0, "successful": 0, "failed": 0}
+            return []
 
         self.logger.info(
             "Processing %s files with %s workers",
@@ -182,23 +734,14 @@ class BatchConverter:
             self.max_workers,
         )
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_file: dict[Future[bool], Path] = {}
-
-            for video_file in video_files:
-                output_file = self._output_path_for_file(
+        jobs = [
+            (
+                video_file,
+                self._output_path_for_file(
                     video_file, input_path, resolved_output_dir, container
-                )
-                future = executor.submit(
-                    self.converter.convert_video,
-                    video_file,
-                    output_file,
-                    container,
-                    overwrite,
-                )
-                future_to_file[future] = video_file
-
-            results = self._collect_batch_results(future_to_file, len(video_files))
-
-        self.logger.info("Batch conversion completed: %s", results)
-        return results
+                ),
+            )
+            for video_file in video_files
+        ]
+        self._create_output_dirs(output_file for _, output_file in jobs)
+        return jobs
@@ -2,13 +2,13 @@
 
 import argparse
 import logging
-import multiprocessing
+import os
 import platform
 import sys
 from pathlib import Path
 
 from dav2mkv import __version__
-from dav2mkv.batch import BatchConverter
+from dav2mkv.batch import BatchConverter, available_cpu_ids, available_cpus
 from dav2mkv.converter import VideoConverter
 from dav2mkv.exceptions import DAVConverterError, FFmpegNotFoundError
 from dav2mkv.log_config import setup_logging
@@ -18,8 +18,25 @@ from dav2mkv.types import (
     CliArgs,
     CliLoggingOptions,
     CliProcessingOptions,
+    ConversionOptions,
 )
 
+_FFMPEG_THREADS_RANGE = (1, 64)
+
+
+def _ffmpeg_threads_arg(value: str) -> int:
+    """Parse and validate the --ffmpeg-threads-per-invocation value."""
+    try:
+        threads = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from exc
+    low, high = _FFMPEG_THREADS_RANGE
+    if not low <= threads <= high:
+        raise argparse.ArgumentTypeError(
+            f"must be between {low} and {high}, got {threads}"
+        )
+    return threads
+
 
 def create_argument_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser."""
@@ -53,8 +70,9 @@ Examples:
     parser.add_argument(
         "--container",
         choices=("mkv", "mp4"),
-        default="mkv",
-        help="Output container format (default: mkv)",
+        action="append",
+        help="Output container format (default: mkv); repeat to write several "
+        "containers from a single FFmpeg run",
     )
 
     parser.add_argument(
@@ -75,13 +93,69 @@ Examples:
         "-c",
         "--concurrent",
         type=int,
-        help="Maximum number of concurrent conversions for directory processing",
+        help="Maximum number of concurrent conversions for directory processing "
+        "(default: CPU count, at most 4)",
     )
 
     parser.add_argument(
         "--recursive", action="store_true", help="Process directories recursively"
     )
 
+    scheduler_group = parser.add_mutually_exclusive_group()
+    scheduler_group.add_argument(
+        "--async",
+        action="store_true",
+        dest="use_async",
+        help="Supervise directory conversions from one asyncio event loop "
+        "instead of a worker thread per conversion",
+    )
+    scheduler_group.add_argument(
+        "--processes",
+        action="store_true",
+        dest="use_processes",
+        help="Run directory conversions in worker processes, each with its "
+        "own interpreter",
+    )
+
+    parser.add_argument(
+        "--ffmpeg-threads-per-invocation",
+        "--ffmpeg-threads",
+        type=_ffmpeg_threads_arg,
+        dest="ffmpeg_threads",
+        metavar="N",
+        help="Threads used by each FFmpeg process, 1-64 "
+        "(default: CPU count divided by concurrent workers in directory mode)",
+    )
+
+    parser.add_argument(
+        "--no-prefetch",
+        action="store_false",
+        dest="prefetch_info",
+        help="Probe each file just before converting it instead of ahead of "
+        "time on a separate pool (lower memory use for very large directories)",
+    )
+
+    parser.add_argument(
+        "--force-remux",
+        action="store_true",
+        help="Run FFmpeg even when the input is already in the target container "
+        "(default: link or copy such files unchanged)",
+    )
+
+    parser.add_argument(
+        "--skip-probe",
+        action="store_true",
+        help="Convert without running ffprobe first (no stream details are "
+        "logged and timestamps are always regenerated)",
+    )
+
+    parser.add_argument(
+        "--pin-cpus",
+        action="store_true",
+        help="Pin each concurrent FFmpeg process to its own share of the "
+        "available CPUs (Linux only)",
+    )
+
     parser.add_argument(
         "--log-level",
         choices=("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"),
@@ -121,20 +195,44 @@ def _namespace_to_cli_args(namespace: argparse.Namespace) -> CliArgs:
     output_value: object = members.get("output")
     concurrent_value: object = members.get("concurrent")
     log_file_value: object = members.get("log_file")
-    container_value: object = members.get("container", "mkv")
+    container_value: object = members.get("container")
     overwrite_value: object = members.get("overwrite", True)
     recursive_value: object = members.get("recursive", False)
+    prefetch_value: object = members.get("prefetch_info", True)
+    ffmpeg_threads_value: object = members.get("ffmpeg_threads")
     log_level_value: object = members.get("log_level", "INFO")
 
+    containers: list[str] = []
+    if isinstance(container_value, list):
+        for container in container_value:
+            if isinstance(container, str) and container not in containers:
+                containers.append(container)
+    elif isinstance(container_value, str):
+        containers.append(container_value)
+
     return CliArgs(
         file=file_value if isinstance(file_value, str) else None,
         directory=directory_value if isinstance(directory_value, str) else None,
         output=output_value if isinstance(output_value, str) else None,
-        container=container_value if isinstance(container_value, str) else "mkv",
+        container=containers[0] if containers else "mkv",
         overwrite=bool(overwrite_value),
         processing=CliProcessingOptions(
             concurrent=concurrent_value if isinstance(concurrent_value, int) else None,
             recursive=bool(recursive_value),
+            prefetch_info=bool(prefetch_value),
+            conversion=ConversionOptions(
+                threads=(
+                    ffmpeg_threads_value
+                    if isinstance(ffmpeg_threads_value, int)
+                    else None
+                ),
+                extra_containers=tuple(containers[1:]),
+                force_remux=bool(members.get("force_remux", False)),
+                skip_probe=bool(members.get("skip_probe", False)),
+                cpu_affinity=available_cpu_ids() if members.get("pin_cpus") else (),
+            ),
+            use_async=bool(members.get("use_async", False)),
+            use_processes=bool(members.get("use_processes", False)),
         ),
         logging=CliLoggingOptions(
             log_level=log_level_value if isinstance(log_level_value, str) else "INFO",
@@ -187,7 +285,11 @@ def _log_system_info(logger: logging.Logger) -> None:
     logger.info("Python version: %s", sys.version)
     logger.info("Platform: %s %s", platform.system(), platform.release())
     logger.info("Architecture: %s", platform.machine())
-    logger.info("CPU count: %s", multiprocessing.cpu_count())
+    logger.info(
+        "CPU count: %s logical, %s available",
+        os.cpu_count(),
+        available_cpus(),
+    )
 
 
 def _run_single_file_mode(converter: VideoConverter, args: CliArgs) -> int:
@@ -202,6 +304,7 @@ def _run_single_file_mode(converter: VideoConverter, args: CliArgs) -> int:
         output_file=args.output,
         container=args.container,
         overwrite=args.overwrite,
+        options=args.processing.conversion,
     )
 
     stats = converter.get_stats()
@@ -233,17 +336,29 @@ def _run_batch_mode(converter: VideoConverter, args: CliArgs) -> int:
     logger = converter.logger
     max_workers = args.processing.concurrent
     if max_workers is not None and max_workers > 0:
-        logger.info("Using %s worker threads", max_workers)
-
-    batch_converter = BatchConverter(converter, max_workers)
+        logger.info("Using %s concurrent workers", max_workers)
+
+    batch_converter = BatchConverter(
+        converter,
+        max_workers,
+        prefetch_info=args.processing.prefetch_info,
+        options=args.processing.conversion,
+        use_processes=args.processing.use_processes,
+    )
 
-    results = batch_converter.convert_directory(
-        input_dir=args.directory,
-        output_dir=args.output,
-        container=args.container,
-        recursive=args.processing.recursive,
-        overwrite=args.overwrite,
+    batch_args = (
+        args.directory,
+        args.output,
+        args.container,
+        args.processing.recursive,
+        args.overwrite,
     )
+    if args.processing.use_async:
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        results = asyncio.run(batch_converter.convert_directory_async(*batch_args))
+    else:
+        results = batch_converter.convert_directory(*batch_args)
 
     converter_stats = converter.get_stats()
     logger.info("Final results: %s", results)
@@ -257,7 +372,11 @@ def main() -> int:
     parser = create_argument_parser()
     args = resolve_input_arguments(parser, parser.parse_args())
 
-    logger = setup_logging(args.logging.log_level, args.logging.log_file)
+    logger = setup_logging(
+        args.logging.log_level,
+        args.logging.log_file,
+        queued=args.directory is not None,
+    )
     exit_code = 1
 
     try:
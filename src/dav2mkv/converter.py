@@ -1,11 +1,19 @@
 """Single-file video conversion using FFmpeg stream copy."""
 
 import logging
+import os
+import shutil
+import stat
 import subprocess
 import threading
 import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import IO, TYPE_CHECKING
 
+from dav2mkv.affinity import pinned_calling_thread, pinned_event_loop_thread
 from dav2mkv.exceptions import VideoProcessingError
 from dav2mkv.probe import (
     VideoInfo,
@@ -13,7 +21,138 @@ from dav2mkv.probe import (
     get_str_field,
     parse_ffprobe_report,
 )
-from dav2mkv.types import ConversionStats, FfprobeStream
+from dav2mkv.types import ConversionOptions, ConversionStats, FfprobeStream
+
+if TYPE_CHECKING:
+    from asyncio import StreamReader
+    from asyncio.subprocess import Process as AsyncProcess
+
+_MUXER_NAMES: dict[str, str] = {"mkv": "matroska", "mp4": "mp4"}
+_MUXER_FLAGS: dict[str, tuple[str, ...]] = {
+    "mkv": ("-cluster_time_limit", "1000"),
+    "mp4": ("-movflags", "+faststart"),
+}
+_PIPE_BUFFER_SIZE = 1 << 20
+_STDERR_TAIL_LINES = 500
+_PROGRESS_TAIL_LINES = 32
+_FFMPEG_STALL_TIMEOUT = 60.0
+_FFPROBE_TIMEOUT = 30
+# Only the fields parse_ffprobe_report keeps; ffprobe skips serialising the
+# dozens of other stream properties and tags it reports by default.
+_FFPROBE_ENTRIES = (
+    "stream=codec_type,codec_name,width,height,r_frame_rate,bit_rate,"
+    "channels,sample_rate:format=duration,size,start_time"
+)
+_WATCHDOG_POLL_INTERVAL = 1.0
+
+
+def _drain_lines(stream: IO[str], sink: Callable[[str], None]) -> None:
+    """Read a pipe to EOF, passing each line on as it arrives."""
+    for line in stream:
+        sink(line.rstrip("\n"))
+
+
+async def _drain_lines_async(
+    stream: "StreamReader | None", sink: Callable[[str], None]
+) -> None:
+    """Read an asyncio subprocess pipe to EOF, passing each decoded line on."""
+    if stream is None:
+        return
+    async for raw_line in stream:
+        sink(raw_line.decode("utf-8", errors="replace").rstrip("\r\n"))
+
+
+def _path_key(path: Path) -> str:
+    """Normalised absolute form of a path, for comparing paths without I/O."""
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _file_signature(path: Path) -> tuple[int, int]:
+    """Size and modification time of a file, or (-1, -1) if it is missing."""
+    try:
+        file_stat = path.stat()
+    except OSError:
+        return -1, -1
+    return file_stat.st_size, file_stat.st_mtime_ns
+
+
+class _ProgressWatchdog:
+    """
+    Track when FFmpeg last showed signs of life.
+
+    New output time on the ``-progress`` pipe counts, and so does any write
+    to the output files: while FFmpeg finalises them (for example moving an
+    MP4 index to the front for faststart) it reports no progress at all.
+    """
+
+    def __init__(self, outputs: Iterable[Path] = ()) -> None:
+        self.lines: deque[str] = deque(maxlen=_PROGRESS_TAIL_LINES)
+        self.last_out_time: str | None = None
+        self.last_tick = time.monotonic()
+        self.outputs = tuple(outputs)
+        self._output_state = self._read_output_state()
+
+    def drain(self, stream: IO[str]) -> None:
+        """Read progress lines to EOF, ticking whenever out_time advances."""
+        for line in stream:
+            self.feed(line.rstrip("\n"))
+
+    def feed(self, line: str) -> None:
+        """Record one progress line."""
+        self.lines.append(line)
+        if line.startswith("out_time=") and line != self.last_out_time:
+            self.last_out_time = line
+            self.last_tick = time.monotonic()
+
+    def stalled_for(self) -> float:
+        """Seconds since the last progress tick or write to an output file."""
+        output_state = self._read_output_state()
+        if output_state != self._output_state:
+            self._output_state = output_state
+            self.last_tick = time.monotonic()
+        return time.monotonic() - self.last_tick
+
+    def _read_output_state(self) -> tuple[tuple[int, int], ...]:
+        """Current size and modification time of every output file."""
+        return tuple(_file_signature(output) for output in self.outputs)
+
+
+class _ProcessRegistry:
+    """
+    Thread-safe set of running FFmpeg processes, so they can be stopped.
+
+    Once terminate_all has run, the cancelled event stays set and processes
+    registered afterwards are terminated straight away, so a conversion that
+    raced past its cancellation check cannot outlive the interrupt.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._processes: set[subprocess.Popen[str]] = set()
+        self.cancelled = threading.Event()
+
+    def add(self, process: subprocess.Popen[str]) -> None:
+        """Register a running process, or terminate it if cancelled."""
+        with self._lock:
+            if not self.cancelled.is_set():
+                self._processes.add(process)
+                return
+        process.terminate()
+
+    def discard(self, process: subprocess.Popen[str]) -> None:
+        """Forget a process once it has exited."""
+        with self._lock:
+            self._processes.discard(process)
+
+    def terminate_all(self) -> int:
+        """Cancel further launches and terminate every running process."""
+        with self._lock:
+            self.cancelled.set()
+            processes = list(self._processes)
+        running = [process for process in processes if process.poll() is None]
+        for process in running:
+            process.terminate()
+        return len(running)
 
 
 class VideoConverter:
@@ -21,7 +160,7 @@ class VideoConverter:
 
     def __init__(self, logger: logging.Logger | None = None) -> None:
         self.logger = logger or logging.getLogger("dav2mkv")
-        self._conversion_lock = threading.Lock()
+        self._active_processes = _ProcessRegistry()
         self._stats: ConversionStats = {
             "conversions_attempted": 0,
             "conversions_successful": 0,
@@ -29,6 +168,8 @@ class VideoConverter:
             "total_processing_time": 0.0,
         }
         self._stats_lock = threading.Lock()
+        self._info_cache: dict[Path, Future[VideoInfo | None]] = {}
+        self._info_cache_lock = threading.Lock()
 
     def get_video_info(self, input_file: str | Path) -> VideoInfo | None:
         """
@@ -41,64 +182,184 @@ class VideoConverter:
             VideoInfo object or None if failed
         """
         input_path = Path(input_file)
+        if not self._can_probe(input_path):
+            return None
+
+        cmd = self._ffprobe_cmd(input_path)
+        try:
+            result = subprocess.run(
+                cmd, capture_output=True, timeout=_FFPROBE_TIMEOUT, check=False
+            )
+        except subprocess.TimeoutExpired:
+            self.logger.error("ffprobe timeout for file: %s", input_path)
+            return None
+        except OSError as exc:
+            self.logger.error("Unexpected error getting video info: %s", exc)
+            return None
+
+        return self._video_info_from_probe(
+            input_path, result.returncode, result.stdout, result.stderr
+        )
+
+    async def get_video_info_async(self, input_file: str | Path) -> VideoInfo | None:
+        """
+        Get video information by running ffprobe from the event loop.
+
+        Args:
+            input_file: Path to the input video file
+
+        Returns:
+            VideoInfo object or None if failed
+        """
+        input_path = Path(input_file)
+        if not self._can_probe(input_path):
+            return None
+
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        cmd = self._ffprobe_cmd(input_path)
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            try:
+                async with asyncio.timeout(_FFPROBE_TIMEOUT):
+                    stdout, stderr = await process.communicate()
+            except TimeoutError:
+                process.kill()
+                await process.wait()
+                self.logger.error("ffprobe timeout for file: %s", input_path)
+                return None
+            returncode = await process.wait()
+        except OSError as exc:
+            self.logger.error("Unexpected error getting video info: %s", exc)
+            return None
+
+        return self._video_info_from_probe(input_path, returncode, stdout, stderr)
+
+    def _can_probe(self, input_path: Path) -> bool:
+        """Check that a probe target exists and is a regular file."""
         self.logger.debug("Getting video info for: %s", input_path)
 
         if not input_path.exists():
             self.logger.error("Input file does not exist: %s", input_path)
-            return None
+            return False
 
         if not input_path.is_file():
             self.logger.error("Input path is not a file: %s", input_path)
-            return None
+            return False
+        return True
 
+    def _ffprobe_cmd(self, input_path: Path) -> list[str]:
+        """Build the ffprobe command for a file."""
         cmd = [
             "ffprobe",
             "-v",
             "quiet",
             "-print_format",
             "json",
-            "-show_format",
-            "-show_streams",
+            "-show_entries",
+            _FFPROBE_ENTRIES,
             str(input_path),
         ]
-
-        video_info: VideoInfo | None = None
-        try:
+        if self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug("Running command: %s", " ".join(cmd))
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=30, check=False
+        return cmd
+
+    def _video_info_from_probe(
+        self, input_path: Path, returncode: int, stdout: bytes, stderr: bytes
+    ) -> VideoInfo | None:
+        """Turn a finished ffprobe run into VideoInfo, logging failures."""
+        if returncode != 0:
+            self.logger.error(
+                "ffprobe failed with return code %s: %s",
+                returncode,
+                stderr.decode("utf-8", errors="replace"),
             )
+            return None
 
-            if result.returncode != 0:
-                self.logger.error(
-                    "ffprobe failed with return code %s: %s",
-                    result.returncode,
-                    result.stderr,
-                )
-            else:
-                report = parse_ffprobe_report(result.stdout)
-                if report is None:
-                    self.logger.error("Failed to parse ffprobe JSON output")
-                else:
-                    video_info = VideoInfo(report)
-                    self.logger.debug(
-                        "Successfully parsed video info for %s", input_path
-                    )
+        report = parse_ffprobe_report(stdout)
+        if report is None:
+            self.logger.error("Failed to parse ffprobe JSON output")
+            return None
 
-        except subprocess.TimeoutExpired:
-            self.logger.error("ffprobe timeout for file: %s", input_path)
-        except OSError as exc:
-            self.logger.error("Unexpected error getting video info: %s", exc)
+        self.logger.debug("Successfully parsed video info for %s", input_path)
+        return VideoInfo(report)
 
-        return video_info
+    def get_video_info_batch(
+        self, input_files: Iterable[str | Path], max_workers: int = 1
+    ) -> dict[Path, VideoInfo]:
+        """
+        Probe several files in parallel and cache the results.
+
+        Subsequent convert_video calls reuse the cached VideoInfo instead of
+        spawning ffprobe again. Entries are held until the file is converted
+        or discard_video_info drops them.
+
+        Args:
+            input_files: Paths of the files to probe
+            max_workers: Maximum number of concurrent ffprobe processes
+
+        Returns:
+            Mapping of resolved input path to VideoInfo for successful probes
+        """
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            paths = self.prefetch_video_info(input_files, executor)
+        with self._info_cache_lock:
+            probes = {path: self._info_cache.get(path) for path in paths}
+        probed = {
+            path: info
+            for path, probe in probes.items()
+            if probe and (info := probe.result())
+        }
+        self.logger.debug("Prefetched video info for %s files", len(probed))
+        return probed
+
+    def prefetch_video_info(
+        self, input_files: Iterable[str | Path], executor: Executor
+    ) -> list[Path]:
+        """
+        Start probing files on executor and return their resolved paths.
+
+        A blocking convert_video of one of these files waits for its probe
+        instead of running ffprobe again, so probing overlaps conversion.
+        """
+        paths = [Path(input_file).resolve() for input_file in input_files]
+        with self._info_cache_lock:
+            for path in paths:
+                self._info_cache[path] = executor.submit(self.get_video_info, path)
+        return paths
+
+    def discard_video_info(self, input_files: Iterable[str | Path]) -> None:
+        """Drop prefetched video info, and cancel queued probes, left unused."""
+        paths = [Path(input_file).resolve() for input_file in input_files]
+        with self._info_cache_lock:
+            probes = [self._info_cache.pop(path, None) for path in paths]
+        for probe in filter(None, probes):
+            probe.cancel()
+
+    def _pop_cached_video_info(
+        self, input_file: Path, wait: bool = True
+    ) -> VideoInfo | None:
+        """Remove and return prefetched video info, waiting on a running probe."""
+        with self._info_cache_lock:
+            if not self._info_cache:
+                return None
+            probe = self._info_cache.pop(input_file.resolve(), None)
+        if probe is None or not (wait or probe.done()):
+            return None
+        return probe.result()
 
     def _record_attempt(self) -> None:
-        """Thread-safe increment of conversion attempts."""
+        """Count a conversion attempt."""
         with self._stats_lock:
             self._stats["conversions_attempted"] += 1
 
     def _record_result(self, successful: bool, processing_time: float = 0.0) -> None:
-        """Thread-safe record of a completed conversion."""
+        """Record a completed conversion."""
         with self._stats_lock:
             if successful:
                 self._stats["conversions_successful"] += 1
@@ -106,16 +367,20 @@ class VideoConverter:
                 self._stats["conversions_failed"] += 1
             self._stats["total_processing_time"] += processing_time
 
-    def _validate_conversion_input(self, input_file: Path, container: str) -> None:
-        """Validate input file and container format."""
-        if not input_file.exists():
-            raise VideoProcessingError(f"Input file not found: {input_file}")
+    def record_conversion(self, successful: bool, processing_time: float) -> None:
+        """Record a conversion that ran outside this converter instance."""
+        self._record_attempt()
+        self._record_result(successful, processing_time)
 
-        if not input_file.is_file():
-            raise VideoProcessingError(f"Input path is not a file: {input_file}")
+    def _validate_conversion_input(self, input_file: Path) -> None:
+        """Validate that the input file exists and is a regular file."""
+        try:
+            mode = input_file.stat().st_mode
+        except (FileNotFoundError, NotADirectoryError) as exc:
+            raise VideoProcessingError(f"Input file not found: {input_file}") from exc
 
-        if container not in ("mkv", "mp4"):
-            raise VideoProcessingError(f"Unsupported container format: {container}")
+        if not stat.S_ISREG(mode):
+            raise VideoProcessingError(f"Input path is not a file: {input_file}")
 
     def _resolve_output_path(
         self,
@@ -129,48 +394,606 @@ class VideoConverter:
         return Path(output_file)
 
     def _build_ffmpeg_cmd(
-        self, input_file: Path, output_file: Path, overwrite: bool
+        self,
+        input_file: Path,
+        outputs: list[tuple[Path, str]],
+        overwrite: bool,
+        threads: int | None = None,
+        fix_timestamps: bool = True,
     ) -> list[str]:
-        """Build the FFmpeg command for stream copy."""
+        """
+        Build the FFmpeg command for stream copy.
+
+        Every (path, container) output is listed after the single input with
+        its own mapping and muxer, so FFmpeg demuxes the input once however
+        many containers are written. MP4 outputs get their index moved to the
+        front for streaming, and MKV clusters are capped at one second.
+        fix_timestamps regenerates missing PTS and shifts negative
+        timestamps to zero.
+        """
+        thread_args = ["-threads", str(threads)] if threads else []
+        genpts_args = ["-fflags", "+genpts"] if fix_timestamps else []
+        shift_args = ["-avoid_negative_ts", "make_zero"] if fix_timestamps else []
         cmd = [
             "ffmpeg",
+            "-hide_banner",
+            "-nostdin",
+            "-loglevel",
+            "error",
+            *thread_args,
+            *genpts_args,
             "-i",
             str(input_file),
-            "-c",
-            "copy",
-            "-map",
-            "0",
-            "-avoid_negative_ts",
-            "make_zero",
-            "-fflags",
-            "+genpts",
+            "-progress",
+            "pipe:1",
+            "-nostats",
+            "-y" if overwrite else "-n",
         ]
-        if overwrite:
-            cmd.append("-y")
-        else:
-            cmd.append("-n")
-        cmd.append(str(output_file))
+        for output_path, container in outputs:
+            cmd.extend(
+                [
+                    "-map",
+                    "0",
+                    "-c",
+                    "copy",
+                    *thread_args,
+                    *shift_args,
+                    *_MUXER_FLAGS[container],
+                    "-f",
+                    _MUXER_NAMES[container],
+                    str(output_path),
+                ]
+            )
         return cmd
 
     def _run_ffmpeg_conversion(
-        self, cmd: list[str]
+        self,
+        cmd: list[str],
+        stall_timeout: float | None = None,
+        cpu_affinity: tuple[int, ...] = (),
+        outputs: Iterable[Path] = (),
+    ) -> subprocess.CompletedProcess[str]:
+        """
+        Run FFmpeg while draining its pipes in background threads.
+
+        Only the last lines of stderr are kept, so memory use stays bounded
+        however long the conversion runs. FFmpeg is killed once its
+        ``-progress`` output stops advancing for ``stall_timeout`` seconds, so
+        large files may take as long as they need while a hung process is
+        caught quickly; writes to the given output files also count as
+        progress. A non-empty cpu_affinity pins FFmpeg to those CPUs.
+        """
+        if self._active_processes.cancelled.is_set():
+            raise VideoProcessingError("Conversion cancelled")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Running FFmpeg command: %s", " ".join(cmd))
+        stall_limit = _FFMPEG_STALL_TIMEOUT if stall_timeout is None else stall_timeout
+        stderr_tail: deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
+        watchdog = _ProgressWatchdog(outputs)
+
+        with pinned_calling_thread(cpu_affinity, self.logger):
+            process = subprocess.Popen(  # pylint: disable=consider-using-with
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=_PIPE_BUFFER_SIZE,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            )
+
+        with process:
+            readers: list[threading.Thread] = []
+            if process.stdout is not None:
+                readers.append(
+                    threading.Thread(
+                        target=watchdog.drain, args=(process.stdout,), daemon=True
+                    )
+                )
+            if process.stderr is not None:
+                readers.append(
+                    threading.Thread(
+                        target=_drain_lines,
+                        args=(process.stderr, self._stderr_sink(stderr_tail)),
+                        daemon=True,
+                    )
+                )
+            for reader in readers:
+                reader.start()
+
+            self._active_processes.add(process)
+            try:
+                returncode = self._wait_with_watchdog(process, watchdog, stall_limit)
+            finally:
+                self._active_processes.discard(process)
+                for reader in readers:
+                    reader.join()
+
+        if watchdog.last_out_time:
+            self.logger.debug("FFmpeg progress: %s", watchdog.last_out_time)
+
+        return subprocess.CompletedProcess(
+            args=cmd,
+            returncode=returncode,
+            stdout="",
+            stderr="\n".join(stderr_tail),
+        )
+
+    def _stderr_sink(self, tail: deque[str]) -> Callable[[str], None]:
+        """
+        Return a callback that keeps FFmpeg stderr lines in a bounded tail.
+
+        With debug logging enabled each line is also logged as it arrives,
+        rather than only when the conversion fails.
+        """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return tail.append
+
+        def sink(line: str) -> None:
+            tail.append(line)
+            self.logger.debug("FFmpeg: %s", line)
+
+        return sink
+
+    def _wait_with_watchdog(
+        self,
+        process: subprocess.Popen[str],
+        watchdog: _ProgressWatchdog,
+        stall_limit: float,
+    ) -> int:
+        """Wait for FFmpeg to exit, killing it if progress stalls."""
+        while True:
+            try:
+                return process.wait(timeout=_WATCHDOG_POLL_INTERVAL)
+            except subprocess.TimeoutExpired:
+                if watchdog.stalled_for() <= stall_limit:
+                    continue
+                self.logger.error(
+                    "FFmpeg made no progress for %.0fs (last %s), killing it",
+                    stall_limit,
+                    watchdog.last_out_time or "out_time=unknown",
+                )
+                process.kill()
+                process.wait()
+                raise
+
+    async def _run_ffmpeg_conversion_async(
+        self,
+        cmd: list[str],
+        stall_timeout: float | None = None,
+        cpu_affinity: tuple[int, ...] = (),
+        outputs: Iterable[Path] = (),
     ) -> subprocess.CompletedProcess[str]:
-        """Run FFmpeg and return the completed process."""
-        self.logger.debug("Running FFmpeg command: %s", " ".join(cmd))
-        return subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=3600,
-            check=False,
+        """
+        Run FFmpeg as an asyncio subprocess with the same stall watchdog.
+
+        Pipes are drained by event-loop tasks rather than threads, so many
+        concurrent conversions need no worker thread each.
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Running FFmpeg command: %s", " ".join(cmd))
+        stall_limit = _FFMPEG_STALL_TIMEOUT if stall_timeout is None else stall_timeout
+        stderr_tail: deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
+        watchdog = _ProgressWatchdog(outputs)
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        async with pinned_event_loop_thread(cpu_affinity, self.logger):
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                limit=_PIPE_BUFFER_SIZE,
+            )
+        readers = [
+            asyncio.create_task(_drain_lines_async(process.stdout, watchdog.feed)),
+            asyncio.create_task(
+                _drain_lines_async(process.stderr, self._stderr_sink(stderr_tail))
+            ),
+        ]
+        try:
+            returncode = await self._wait_with_watchdog_async(
+                cmd, process, watchdog, stall_limit
+            )
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            await asyncio.gather(*readers)
+
+        if watchdog.last_out_time:
+            self.logger.debug("FFmpeg progress: %s", watchdog.last_out_time)
+
+        return subprocess.CompletedProcess(
+            args=cmd,
+            returncode=returncode,
+            stdout="",
+            stderr="\n".join(stderr_tail),
         )
 
+    async def _wait_with_watchdog_async(
+        self,
+        cmd: list[str],
+        process: "AsyncProcess",
+        watchdog: _ProgressWatchdog,
+        stall_limit: float,
+    ) -> int:
+        """Await FFmpeg's exit, killing it if progress stalls."""
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        while True:
+            try:
+                return await asyncio.wait_for(process.wait(), _WATCHDOG_POLL_INTERVAL)
+            except TimeoutError:
+                if watchdog.stalled_for() <= stall_limit:
+                    continue
+                self.logger.error(
+                    "FFmpeg made no progress for %.0fs (last %s), killing it",
+                    stall_limit,
+                    watchdog.last_out_time or "out_time=unknown",
+                )
+                process.kill()
+                await process.wait()
+                raise subprocess.TimeoutExpired(cmd, stall_limit) from None
+
+    def _plan_outputs(
+        self,
+        input_file: Path,
+        output_file: str | Path | None,
+        container: str,
+        options: ConversionOptions,
+    ) -> list[tuple[Path, str]]:
+        """Validate the request and return (output path, container) pairs."""
+        containers = [container]
+        for extra in options.extra_containers:
+            if extra not in containers:
+                containers.append(extra)
+        for target_container in containers:
+            if target_container not in _MUXER_NAMES:
+                raise VideoProcessingError(
+                    f"Unsupported container format: {target_container}"
+                )
+        if not options.skip_input_check:
+            self._validate_conversion_input(input_file)
+
+        resolved_output = self._resolve_output_path(input_file, output_file, container)
+        planned = [(resolved_output, container)] + [
+            (resolved_output.with_suffix(f".{extra}"), extra)
+            for extra in containers[1:]
+        ]
+        return self._check_output_paths(input_file, planned, options)
+
+    def _check_output_paths(
+        self,
+        input_file: Path,
+        planned: list[tuple[Path, str]],
+        options: ConversionOptions,
+    ) -> list[tuple[Path, str]]:
+        """
+        Reject output paths that collide and keep the input off the list.
+
+        Two containers cannot be written to one path by one FFmpeg run. An
+        output at the input's own path is dropped when the input already is
+        that container and other containers are still to be written; as the
+        only output it is left for the same-container shortcut, unless a
+        remux was forced, which would make FFmpeg overwrite its own input.
+        """
+        input_key = _path_key(input_file)
+        seen: set[str] = set()
+        outputs: list[tuple[Path, str]] = []
+        for output_path, target_container in planned:
+            key = _path_key(output_path)
+            if key in seen:
+                raise VideoProcessingError(
+                    f"Several containers would be written to {output_path}"
+                )
+            seen.add(key)
+            if key != input_key:
+                outputs.append((output_path, target_container))
+            elif output_path.suffix.lower() != f".{target_container}" or (
+                len(planned) == 1 and options.force_remux
+            ):
+                raise VideoProcessingError(
+                    f"Output would overwrite the input file: {output_path}"
+                )
+            elif len(planned) == 1:
+                outputs.append((output_path, target_container))
+        return outputs
+
+    def _log_reused_input(
+        self,
+        input_file: Path,
+        outputs: list[tuple[Path, str]],
+        container: str,
+        options: ConversionOptions,
+    ) -> None:
+        """Note a container _check_output_paths left to the input itself."""
+        written = {target_container for _, target_container in outputs}
+        for target_container in (container, *options.extra_containers):
+            if target_container not in written:
+                self.logger.info(
+                    "Input is already %s, writing only the other containers: %s",
+                    target_container.upper(),
+                    input_file,
+                )
+                return
+
+    def _run_attempts(
+        self,
+        cmds: list[list[str]],
+        input_file: Path,
+        outputs: list[tuple[Path, str]],
+        cpu_affinity: tuple[int, ...] = (),
+    ) -> bool:
+        """Run FFmpeg commands in turn until one produces verified outputs."""
+        for attempt, cmd in enumerate(cmds):
+            if attempt:
+                self.logger.warning(
+                    "Retrying with timestamp regeneration: %s", input_file
+                )
+            process = self._run_ffmpeg_conversion(
+                cmd,
+                cpu_affinity=cpu_affinity,
+                outputs=[output_path for output_path, _ in outputs],
+            )
+            if self._check_ffmpeg_result(process, input_file, outputs):
+                return True
+            if not self._may_retry(process):
+                break
+        return False
+
+    async def _run_attempts_async(
+        self,
+        cmds: list[list[str]],
+        input_file: Path,
+        outputs: list[tuple[Path, str]],
+        cpu_affinity: tuple[int, ...] = (),
+    ) -> bool:
+        """Async counterpart of _run_attempts."""
+        for attempt, cmd in enumerate(cmds):
+            if attempt:
+                self.logger.warning(
+                    "Retrying with timestamp regeneration: %s", input_file
+                )
+            process = await self._run_ffmpeg_conversion_async(
+                cmd,
+                cpu_affinity=cpu_affinity,
+                outputs=[output_path for output_path, _ in outputs],
+            )
+            if self._check_ffmpeg_result(process, input_file, outputs):
+                return True
+            if not self._may_retry(process):
+                break
+        return False
+
+    def _may_retry(self, process: subprocess.CompletedProcess[str]) -> bool:
+        """
+        Whether a failed attempt may be followed by the next command.
+
+        A run ended by a signal was stopped on purpose (an interrupt or
+        terminate_active_processes), so it is never retried, and nothing is
+        retried once the converter has been cancelled.
+        """
+        return process.returncode >= 0 and not self._active_processes.cancelled.is_set()
+
+    def _check_ffmpeg_result(
+        self,
+        process: subprocess.CompletedProcess[str],
+        input_file: Path,
+        outputs: list[tuple[Path, str]],
+    ) -> bool:
+        """Check FFmpeg's exit status and verify every output it should produce."""
+        if process.returncode != 0:
+            error_msg = process.stderr.strip() if process.stderr else "Unknown error"
+            self.logger.error(
+                "FFmpeg conversion failed (code %s): %s",
+                process.returncode,
+                error_msg,
+            )
+            return False
+
+        for output_path, _ in outputs:
+            if not self._verify_output_file(output_path, input_file):
+                self.logger.error("Output file verification failed")
+                return False
+        return True
+
+    def _copy_without_remux(
+        self, input_file: Path, output_file: Path, overwrite: bool
+    ) -> bool:
+        """
+        Hard-link (or copy) an input already in the target container.
+
+        Remuxing into the same container only rewrites the file, so the
+        output is created without running FFmpeg at all.
+        """
+        if output_file.exists():
+            if output_file.samefile(input_file):
+                self.logger.info("Already in target container: %s", input_file)
+                return True
+            if not overwrite:
+                self.logger.warning(
+                    "Output file exists and overwrite disabled: %s", output_file
+                )
+                return False
+            output_file.unlink()
+
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(input_file, output_file)
+            self.logger.info("Linked without remux: %s -> %s", input_file, output_file)
+        except OSError:
+            shutil.copy2(input_file, output_file)
+            self.logger.info("Copied without remux: %s -> %s", input_file, output_file)
+        return True
+
+    def _prepare_ffmpeg_attempts(
+        self,
+        input_file: Path,
+        outputs: list[tuple[Path, str]],
+        overwrite: bool,
+        options: ConversionOptions,
+        video_info: VideoInfo | None,
+    ) -> list[list[str]]:
+        """
+        Create the output directory and build the FFmpeg commands to try.
+
+        Inputs that probe with a non-negative start time are first copied
+        without PTS regeneration, with a second command enabling the
+        timestamp fixes in case that attempt fails.
+        """
+        if not options.skip_mkdir:
+            outputs[0][0].parent.mkdir(parents=True, exist_ok=True)
+
+        for output_path, target_container in outputs:
+            self.logger.info(
+                "Converting to %s: %s -> %s",
+                target_container.upper(),
+                input_file,
+                output_path,
+            )
+
+        if video_info is None or not video_info.has_non_negative_start_time():
+            return [
+                self._build_ffmpeg_cmd(input_file, outputs, overwrite, options.threads)
+            ]
+        return [
+            self._build_ffmpeg_cmd(
+                input_file, outputs, overwrite, options.threads, False
+            ),
+            # Outputs were absent or overwritable before the first attempt, so
+            # anything there by the retry is that attempt's partial output.
+            self._build_ffmpeg_cmd(input_file, outputs, True, options.threads),
+        ]
+
+    def _conversion_shortcut(
+        self,
+        input_file: Path,
+        outputs: list[tuple[Path, str]],
+        overwrite: bool,
+        options: ConversionOptions,
+    ) -> bool | None:
+        """
+        Settle a conversion without FFmpeg where possible.
+
+        Returns the outcome when no FFmpeg run is needed, or None otherwise.
+        """
+        if self._is_same_container_copy(input_file, outputs, options):
+            return self._copy_without_remux(input_file, outputs[0][0], overwrite)
+
+        blocked = self._blocked_output(outputs, overwrite)
+        if blocked is not None:
+            self.logger.warning(
+                "Output file exists and overwrite disabled: %s", blocked
+            )
+            return False
+        return None
+
+    def _is_same_container_copy(
+        self,
+        input_file: Path,
+        outputs: list[tuple[Path, str]],
+        options: ConversionOptions,
+    ) -> bool:
+        """Whether the input can be linked or copied instead of remuxed."""
+        return (
+            len(outputs) == 1
+            and not options.force_remux
+            and input_file.suffix.lower() == f".{outputs[0][1]}"
+        )
+
+    def _blocked_output(
+        self, outputs: list[tuple[Path, str]], overwrite: bool
+    ) -> Path | None:
+        """Return the first output that exists and may not be overwritten."""
+        if overwrite:
+            return None
+        return next((path for path, _ in outputs if path.exists()), None)
+
+    def will_run_ffmpeg(
+        self,
+        input_file: str | Path,
+        output_file: str | Path | None = None,
+        container: str = "mkv",
+        overwrite: bool = True,
+        options: ConversionOptions | None = None,
+    ) -> bool:
+        """
+        Whether convert_video would launch FFmpeg for these arguments.
+
+        Same-container inputs are linked or copied and existing outputs kept
+        by overwrite=False are skipped; invalid requests also return False.
+        """
+        input_path = Path(input_file)
+        options = options or ConversionOptions()
+        try:
+            outputs = self._plan_outputs(input_path, output_file, container, options)
+        except (OSError, VideoProcessingError):
+            return False
+        return (
+            not self._is_same_container_copy(input_path, outputs, options)
+            and self._blocked_output(outputs, overwrite) is None
+        )
+
+    def _finish_conversion(
+        self, success: bool, outputs: list[tuple[Path, str]], start_time: float
+    ) -> bool:
+        """Log and record the outcome of a conversion."""
+        processing_time = time.monotonic() - start_time
+        if success:
+            self.logger.info(
+                "Conversion successful: %s (%.2fs)", outputs[0][0], processing_time
+            )
+        self._record_result(success, processing_time)
+        return success
+
+    def _fail_conversion(
+        self, exc: Exception, input_file: Path, start_time: float
+    ) -> bool:
+        """Log and record a conversion aborted by an exception."""
+        processing_time = time.monotonic() - start_time
+        if isinstance(exc, subprocess.TimeoutExpired):
+            self.logger.error(
+                "Conversion timeout after %.2fs: %s", processing_time, input_file
+            )
+        else:
+            self.logger.error("Conversion failed with exception: %s", exc)
+        self._record_result(False, processing_time)
+        return False
+
+    def _analyze_input(self, input_file: Path) -> VideoInfo | None:
+        """Probe the input (or reuse prefetched info) and log its details."""
+        self.logger.info("Analyzing video file: %s", input_file)
+        video_info = self._pop_cached_video_info(input_file) or self.get_video_info(
+            input_file
+        )
+        self._log_analysis(video_info)
+        return video_info
+
+    async def _analyze_input_async(self, input_file: Path) -> VideoInfo | None:
+        """Async counterpart of _analyze_input."""
+        self.logger.info("Analyzing video file: %s", input_file)
+        video_info = self._pop_cached_video_info(
+            input_file, wait=False
+        ) or await self.get_video_info_async(input_file)
+        self._log_analysis(video_info)
+        return video_info
+
+    def _log_analysis(self, video_info: VideoInfo | None) -> None:
+        """Log probe results, or a warning when probing failed."""
+        if video_info:
+            self._log_video_info(video_info)
+        else:
+            self.logger.warning("Could not retrieve video information")
+
     def convert_video(
         self,
         input_file: str | Path,
         output_file: str | Path | None = None,
         container: str = "mkv",
         overwrite: bool = True,
+        options: ConversionOptions | None = None,
     ) -> bool:
         """
         Convert a single video file using direct stream copy.
@@ -180,90 +1003,112 @@ class VideoConverter:
             output_file: Path for output file (optional)
             container: Output container format ('mkv' or 'mp4')
             overwrite: Whether to overwrite existing output file
+            options: Optional FFmpeg settings; extra containers are written
+                next to the output file from the same FFmpeg run. Inputs
+                already in the target container are linked or copied instead
+                of remuxed unless force_remux is set. Callers that create the
+                output directory themselves can set skip_mkdir, and callers
+                that found the input by scanning its directory can set
+                skip_input_check. skip_probe converts without running
+                ffprobe first, always applying the timestamp fixes.
+                cpu_affinity pins FFmpeg to the listed CPUs (Linux only).
 
         Returns:
             True if conversion successful, False otherwise
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         input_path = Path(input_file)
-
-        with self._conversion_lock:
-            self.logger.info("Starting conversion of: %s", input_path)
-
-        self._record_attempt()
+        options = options or ConversionOptions()
+        self._start_conversion(input_path)
 
         try:
-            self._validate_conversion_input(input_path, container)
-            resolved_output = self._resolve_output_path(
-                input_path, output_file, container
+            outputs = self._plan_outputs(input_path, output_file, container, options)
+            self._log_reused_input(input_path, outputs, container, options)
+            shortcut = self._conversion_shortcut(
+                input_path, outputs, overwrite, options
             )
+            if shortcut is not None:
+                return self._finish_conversion(shortcut, outputs, start_time)
 
-            if resolved_output.exists() and not overwrite:
-                self.logger.warning(
-                    "Output file exists and overwrite disabled: %s", resolved_output
-                )
-                return False
+            video_info = None if options.skip_probe else self._analyze_input(input_path)
+            cmds = self._prepare_ffmpeg_attempts(
+                input_path, outputs, overwrite, options, video_info
+            )
+            success = self._run_attempts(
+                cmds, input_path, outputs, options.cpu_affinity
+            )
+            return self._finish_conversion(success, outputs, start_time)
 
-            self.logger.info("Analyzing video file: %s", input_path)
-            video_info = self.get_video_info(input_path)
+        except (subprocess.TimeoutExpired, OSError, VideoProcessingError) as exc:
+            return self._fail_conversion(exc, input_path, start_time)
 
-            if video_info:
-                self._log_video_info(video_info)
-            else:
-                self.logger.warning("Could not retrieve video information")
+    async def convert_video_async(
+        self,
+        input_file: str | Path,
+        output_file: str | Path | None = None,
+        container: str = "mkv",
+        overwrite: bool = True,
+        options: ConversionOptions | None = None,
+    ) -> bool:
+        """
+        Convert a single video file with ffprobe and FFmpeg run as asyncio
+        subprocesses.
 
-            resolved_output.parent.mkdir(parents=True, exist_ok=True)
+        Takes the same arguments and returns the same result as
+        convert_video. Intended for running many conversions from one event
+        loop, where each in-flight FFmpeg costs a task instead of a thread.
+        """
+        start_time = time.monotonic()
+        input_path = Path(input_file)
+        options = options or ConversionOptions()
+        self._start_conversion(input_path)
 
-            self.logger.info(
-                "Converting to %s: %s -> %s",
-                container.upper(),
-                input_path,
-                resolved_output,
+        try:
+            outputs = self._plan_outputs(input_path, output_file, container, options)
+            self._log_reused_input(input_path, outputs, container, options)
+            shortcut = self._conversion_shortcut(
+                input_path, outputs, overwrite, options
             )
+            if shortcut is not None:
+                return self._finish_conversion(shortcut, outputs, start_time)
 
-            cmd = self._build_ffmpeg_cmd(input_path, resolved_output, overwrite)
-            process = self._run_ffmpeg_conversion(cmd)
-            processing_time = time.time() - start_time
+            video_info = (
+                None
+                if options.skip_probe
+                else await self._analyze_input_async(input_path)
+            )
+            cmds = self._prepare_ffmpeg_attempts(
+                input_path, outputs, overwrite, options, video_info
+            )
+            success = await self._run_attempts_async(
+                cmds, input_path, outputs, options.cpu_affinity
+            )
+            return self._finish_conversion(success, outputs, start_time)
 
-            if process.returncode != 0:
-                error_msg = (
-                    process.stderr.strip() if process.stderr else "Unknown error"
-                )
-                self.logger.error(
-                    "FFmpeg conversion failed (code %s): %s",
-                    process.returncode,
-                    error_msg,
-                )
-                self._record_result(False, processing_time)
-                return False
+        except (subprocess.TimeoutExpired, OSError, VideoProcessingError) as exc:
+            return self._fail_conversion(exc, input_path, start_time)
 
-            if not self._verify_output_file(resolved_output, input_path):
-                self.logger.error("Output file verification failed")
-                self._record_result(False, processing_time)
-                return False
+    def terminate_active_processes(self) -> int:
+        """
+        Terminate FFmpeg processes started by blocking conversions.
 
-            self.logger.info(
-                "Conversion successful: %s (%.2fs)",
-                resolved_output,
-                processing_time,
-            )
-            self._record_result(True, processing_time)
-            return True
+        Used when a batch is interrupted. Until reset_cancellation is called,
+        blocking conversions fail instead of starting or retrying FFmpeg.
+        Event-loop conversions are not tracked; cancelling them kills FFmpeg.
 
-        except subprocess.TimeoutExpired:
-            processing_time = time.time() - start_time
-            self.logger.error(
-                "Conversion timeout after %.2fs: %s",
-                processing_time,
-                input_path,
-            )
-            self._record_result(False, processing_time)
-            return False
-        except (OSError, VideoProcessingError) as exc:
-            processing_time = time.time() - start_time
-            self.logger.error("Conversion failed with exception: %s", exc)
-            self._record_result(False, processing_time)
-            return False
+        Returns:
+            Number of processes that were still running
+        """
+        return self._active_processes.terminate_all()
+
+    def reset_cancellation(self) -> None:
+        """Allow FFmpeg to be started again after terminate_active_processes."""
+        self._active_processes.cancelled.clear()
+
+    def _start_conversion(self, input_file: Path) -> None:
+        """Log the start of a conversion and count the attempt."""
+        self.logger.info("Starting conversion of: %s", input_file)
+        self._record_attempt()
 
     def _log_primary_video_stream(self, video_stream: FfprobeStream) -> None:
         """Log primary video stream details."""
@@ -344,11 +1189,12 @@ class VideoConverter:
             True if verification passes, False otherwise
         """
         try:
-            if not output_file.exists():
+            try:
+                output_size = output_file.stat().st_size
+            except FileNotFoundError:
                 self.logger.error("Output file does not exist: %s", output_file)
                 return False
 
-            output_size = output_file.stat().st_size
             if output_size == 0:
                 self.logger.error("Output file is empty: %s", output_file)
                 return False
@@ -1,12 +1,21 @@
 """Logging configuration for the DAV video converter."""
 
+import atexit
 import logging
 import os
+import queue
 import sys
 import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
 
 _log_lock = threading.Lock()
 
+_QUEUE_LISTENERS: list[QueueListener] = []
+
 _LOG_LEVELS: dict[str, int] = {
     "DEBUG": logging.DEBUG,
     "INFO": logging.INFO,
@@ -17,7 +26,7 @@ _LOG_LEVELS: dict[str, int] = {
 
 
 def setup_logging(
-    log_level: str = "INFO", log_file: str | None = None
+    log_level: str = "INFO", log_file: str | None = None, queued: bool = False
 ) -> logging.Logger:
     """
     Set up comprehensive logging for the application.
@@ -25,6 +34,8 @@ def setup_logging(
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional log file path
+        queued: Hand records to a background thread that does the console
+            and file I/O, so concurrent workers only enqueue records
 
     Returns:
         Configured logger instance
@@ -66,4 +77,71 @@ def setup_logging(
             except OSError as exc:
                 logger.warning("Failed to setup file logging: %s", exc)
 
+        if queued:
+            _route_through_queue(logger)
+
     return logger
+
+
+def _route_through_queue(logger: logging.Logger) -> None:
+    """Move a logger's handlers behind a QueueHandler and a QueueListener."""
+    handlers = logger.handlers[:]
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(records, *handlers, respect_handler_level=True)
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(records))
+    listener.start()
+    if not _QUEUE_LISTENERS:
+        atexit.register(stop_queued_logging)
+    _QUEUE_LISTENERS.append(listener)
+
+
+def stop_queued_logging() -> None:
+    """Flush queued log records and stop their listener threads."""
+    while _QUEUE_LISTENERS:
+        _QUEUE_LISTENERS.pop().stop()
+
+
+class _ReplayHandler(logging.Handler):
+    """Hand records from worker processes to the same-named local logger."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+def setup_worker_logging(
+    log_level: str, records: "Queue[logging.LogRecord]"
+) -> logging.Logger:
+    """
+    Configure a worker process to send its log records to the parent.
+
+    The parent replays them with forward_worker_logs, so worker output
+    reaches the parent's console and log file.
+
+    Args:
+        log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        records: Queue shared with the parent process
+
+    Returns:
+        Configured logger instance
+    """
+    with _log_lock:
+        logger = logging.getLogger("dav2mkv")
+        logger.setLevel(_LOG_LEVELS.get(log_level.upper(), logging.INFO))
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+        logger.addHandler(QueueHandler(records))
+    return logger
+
+
+def forward_worker_logs(records: "Queue[logging.LogRecord]") -> QueueListener:
+    """
+    Replay log records from worker processes through this process's loggers.
+
+    Returns:
+        The running listener; stopping it flushes the remaining records
+    """
+    listener = QueueListener(records, _ReplayHandler())
+    listener.start()
+    return listener
@@ -1,9 +1,12 @@
 """FFprobe parsing and FFmpeg availability checks."""
 
+import importlib
 import json
 import logging
+import shutil
 import subprocess
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
+from typing import cast
 
 from dav2mkv.types import (
     FfprobeFormat,
@@ -12,6 +15,22 @@ from dav2mkv.types import (
     StreamCounts,
 )
 
+_JsonLoads = Callable[[str | bytes], object]
+
+
+def _load_json_loads() -> _JsonLoads:
+    """Return orjson.loads when the optional dependency is installed."""
+    try:
+        orjson = importlib.import_module("orjson")
+    except ImportError:
+        return cast(_JsonLoads, json.loads)
+    return cast(_JsonLoads, getattr(orjson, "loads"))
+
+
+_json_loads = _load_json_loads()
+
+_FFMPEG_VERSION_CACHE: dict[tuple[str | None, str | None], str] = {}
+
 
 def get_str_field(
     mapping: Mapping[str, object], key: str, default: str = "unknown"
@@ -81,18 +100,23 @@ def _parse_ffprobe_format(raw: object) -> FfprobeFormat:
     if not isinstance(raw, dict):
         return {}
     format_info: FfprobeFormat = {}
-    for key in ("duration", "size"):
+    for key in ("duration", "size", "start_time"):
         value: object = raw.get(key)
         if isinstance(value, str):
             format_info[key] = value
     return format_info
 
 
-def parse_ffprobe_report(stdout: str) -> FfprobeReport | None:
-    """Parse and validate ffprobe JSON output."""
+def parse_ffprobe_report(stdout: str | bytes) -> FfprobeReport | None:
+    """
+    Parse and validate ffprobe JSON output.
+
+    Raw bytes are accepted so callers can skip decoding the subprocess output;
+    orjson parses them directly when installed.
+    """
     try:
-        decoded: object = json.loads(stdout)
-    except json.JSONDecodeError:
+        decoded: object = _json_loads(stdout)
+    except ValueError:
         return None
 
     if not isinstance(decoded, dict):
@@ -114,13 +138,37 @@ def parse_ffprobe_report(stdout: str) -> FfprobeReport | None:
     return {"streams": streams, "format": format_info}
 
 
+def clear_ffmpeg_availability_cache() -> None:
+    """Clear the cached FFmpeg availability result (for tests)."""
+    _FFMPEG_VERSION_CACHE.clear()
+
+
 def check_ffmpeg_availability() -> tuple[bool, str | None]:
     """
     Check if FFmpeg is available in the system PATH.
 
+    A successful check is cached for the life of the process, keyed on where
+    ``ffmpeg`` and ``ffprobe`` resolve in PATH, so library callers can check
+    before every batch without respawning FFmpeg while a changed PATH is
+    still re-checked. Failures are not cached, letting a later call pick up
+    a newly installed FFmpeg.
+
     Returns:
         Tuple of (is_available: bool, version: Optional[str])
     """
+    key = (shutil.which("ffmpeg"), shutil.which("ffprobe"))
+    cached = _FFMPEG_VERSION_CACHE.get(key)
+    if cached is not None:
+        return True, cached
+
+    available, version = _run_ffmpeg_version_checks()
+    if available and version is not None:
+        _FFMPEG_VERSION_CACHE[key] = version
+    return available, version
+
+
+def _run_ffmpeg_version_checks() -> tuple[bool, str | None]:
+    """Run ``ffmpeg -version`` and ``ffprobe -version``."""
     logger = logging.getLogger("dav2mkv")
 
     try:
@@ -163,8 +211,9 @@ def check_ffmpeg_availability() -> tuple[bool, str | None]:
 class VideoInfo:
     """Container for video information."""
 
+    __slots__ = ("streams", "format_info", "stream_counts", "_by_type")
+
     def __init__(self, data: FfprobeReport) -> None:
-        self.raw_data: FfprobeReport = data
         self.streams: list[FfprobeStream] = data["streams"]
         self.format_info: FfprobeFormat = data["format"]
 
@@ -176,36 +225,36 @@ class VideoInfo:
             "unknown": 0,
         }
 
+        self._by_type: dict[str, list[FfprobeStream]] = {}
         for stream in self.streams:
             stream_type = get_str_field(stream, "codec_type", "unknown")
+            self._by_type.setdefault(stream_type, []).append(stream)
             _increment_stream_count(self.stream_counts, stream_type)
 
     def get_video_streams(self) -> list[FfprobeStream]:
         """Get all video streams."""
-        return [
-            stream
-            for stream in self.streams
-            if get_str_field(stream, "codec_type") == "video"
-        ]
+        return self._by_type.get("video", [])
 
     def get_audio_streams(self) -> list[FfprobeStream]:
         """Get all audio streams."""
-        return [
-            stream
-            for stream in self.streams
-            if get_str_field(stream, "codec_type") == "audio"
-        ]
+        return self._by_type.get("audio", [])
+
+    def has_non_negative_start_time(self) -> bool:
+        """Whether the container reports a start time at or after zero."""
+        start_time = self.format_info.get("start_time")
+        if start_time is None:
+            return False
+        try:
+            return float(start_time) >= 0
+        except ValueError:
+            return False
 
     def get_primary_video_info(self) -> FfprobeStream:
         """Get primary video stream information."""
-        video_streams = self.get_video_streams()
-        if video_streams:
-            return video_streams[0]
-        return {}
+        video_streams = self._by_type.get("video")
+        return video_streams[0] if video_streams else {}
 
     def get_primary_audio_info(self) -> FfprobeStream:
         """Get primary audio stream information."""
-        audio_streams = self.get_audio_streams()
-        if audio_streams:
-            return audio_streams[0]
-        return {}
+        audio_streams = self._by_type.get("audio")
+        return audio_streams[0] if audio_streams else {}
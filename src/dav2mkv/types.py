@@ -22,6 +22,7 @@ class FfprobeFormat(TypedDict, total=False):
 
     duration: str
     size: str
+    start_time: str
 
 
 class FfprobeReport(TypedDict):
@@ -58,6 +59,19 @@ class BatchResults(TypedDict):
     failed: int
 
 
+@dataclass(frozen=True)
+class ConversionOptions:
+    """Optional FFmpeg settings applied to each conversion."""
+
+    threads: int | None = None
+    extra_containers: tuple[str, ...] = ()
+    force_remux: bool = False
+    skip_mkdir: bool = False
+    skip_input_check: bool = False
+    skip_probe: bool = False
+    cpu_affinity: tuple[int, ...] = ()
+
+
 @dataclass
 class CliLoggingOptions:
     """Logging options from the command line."""
@@ -68,10 +82,14 @@ class CliLoggingOptions:
 
 @dataclass
 class CliProcessingOptions:
-    """Batch processing options from the command line."""
+    """Processing options from the command line."""
 
     concurrent: int | None
     recursive: bool
+    prefetch_info: bool = True
+    conversion: ConversionOptions = ConversionOptions()
+    use_async: bool = False
+    use_processes: bool = False
 
 
 @dataclass
@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 import pytest
 
+from dav2mkv.probe import clear_ffmpeg_availability_cache
 
-@pytest.fixture
+
+@pytest.fixture(autouse=True)
+def _reset_ffmpeg_availability_cache() -> None:
+    """Keep cached FFmpeg checks from leaking between tests."""
+    clear_ffmpeg_availability_cache()
+
+
+@pytest.fixture(scope="session")
 def sample_ffprobe_json() -> str:
     """Valid ffprobe JSON for a file with video and audio streams."""
     payload = {
@@ -43,7 +52,8 @@ def sample_ffprobe_json() -> str:
 
 @pytest.fixture
 def temp_video_file(tmp_path: Path) -> Path:
-    """Create a small dummy input file."""
+    """Create a small sparse dummy input file; its bytes are never decoded."""
     video_file = tmp_path / "input.dav"
-    video_file.write_bytes(b"fake video content" * 100)
+    video_file.touch()
+    os.truncate(video_file, 1800)
     return video_file
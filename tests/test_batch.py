@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
 import logging
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pytest
+
+from dav2mkv import batch as batch_module
 from dav2mkv.batch import BatchConverter
 from dav2mkv.converter import VideoConverter
+from dav2mkv.types import ConversionOptions
 
 
 def test_find_video_files_non_recursive(tmp_path: Path) -> None:
@@ -41,6 +52,87 @@ def test_find_video_files_recursive(tmp_path: Path) -> None:
     assert files == [tmp_path / "clip.dav", subdir / "deep.dav"]
 
 
+def test_find_video_files_recursive_walks_every_level(
+    mocker: MagicMock, tmp_path: Path
+) -> None:
+    expected = []
+    for branch in ("a", "b", "c"):
+        level = tmp_path / branch
+        for depth in range(3):
+            level = level / f"d{depth}"
+            level.mkdir(parents=True)
+            (level / "clip.dav").write_bytes(b"video")
+            expected.append(level / "clip.dav")
+
+    converter = VideoConverter(logging.getLogger("test_batch_find_levels"))
+    batch = BatchConverter(converter, max_workers=2)
+
+    assert batch.find_video_files(tmp_path, recursive=True) == sorted(expected)
+    unsorted = batch.find_video_files(tmp_path, recursive=True, sort=False)
+    assert sorted(unsorted) == sorted(expected)
+
+    find_spy = mocker.spy(batch, "find_video_files")
+    jobs = batch._prepare_jobs(tmp_path, None, "mkv", recursive=True)
+    assert find_spy.call_args.kwargs["sort"] is False
+    assert sorted(video_file for video_file, _ in jobs) == sorted(expected)
+
+
+def test_find_video_files_ignores_dotfiles_named_like_extensions(
+    tmp_path: Path,
+) -> None:
+    (tmp_path / ".dav").write_bytes(b"hidden")
+    (tmp_path / ".clip.dav").write_bytes(b"video")
+
+    batch = BatchConverter(VideoConverter(logging.getLogger("test_batch_dotfile")))
+
+    assert batch.find_video_files(tmp_path) == [tmp_path / ".clip.dav"]
+
+
+def test_find_video_files_matches_extension_case_insensitively(
+    tmp_path: Path,
+) -> None:
+    (tmp_path / "UPPER.DAV").write_bytes(b"video")
+    (tmp_path / "dav").write_bytes(b"no extension")
+    (tmp_path / "archive.dav.txt").write_bytes(b"text")
+    (tmp_path / "folder.mkv").mkdir()
+
+    logger = logging.getLogger("test_batch_find_case")
+    batch = BatchConverter(VideoConverter(logger))
+
+    assert batch.find_video_files(tmp_path, recursive=True) == [tmp_path / "UPPER.DAV"]
+
+
+def test_find_video_files_skips_unreadable_subdirectory(
+    mocker: MagicMock, tmp_path: Path
+) -> None:
+    (tmp_path / "ok").mkdir()
+    (tmp_path / "ok" / "a.dav").write_bytes(b"a")
+    (tmp_path / "locked").mkdir()
+    (tmp_path / "locked" / "b.dav").write_bytes(b"b")
+    real_scandir = os.scandir
+
+    def scandir(path: str) -> object:
+        if path.endswith("locked"):
+            raise PermissionError(13, "Permission denied", path)
+        return real_scandir(path)
+
+    mocker.patch("dav2mkv.batch.os.scandir", side_effect=scandir)
+    batch = BatchConverter(VideoConverter(logging.getLogger("test_batch_perm")))
+
+    assert batch.find_video_files(tmp_path, recursive=True) == [
+        tmp_path / "ok" / "a.dav"
+    ]
+
+
+def test_video_extensions_are_shared_lowercase_suffixes() -> None:
+    batch = BatchConverter(VideoConverter(logging.getLogger("test_batch_exts")))
+
+    assert batch.video_extensions is batch_module.VIDEO_EXTENSIONS
+    assert all(
+        ext.startswith(".") and ext == ext.lower() for ext in batch.video_extensions
+    )
+
+
 def test_find_video_files_missing_directory(tmp_path: Path) -> None:
     logger = logging.getLogger("test_batch_missing_dir")
     converter = VideoConverter(logger)
@@ -76,6 +168,13 @@ def test_output_path_for_file_preserves_structure(tmp_path: Path) -> None:
 
     output_path = batch._output_path_for_file(video_file, input_dir, output_dir, "mkv")
     assert output_path == output_dir / "nested" / "clip.mkv"
+    assert (
+        batch._output_path_for_file(video_file, input_dir, input_dir, "mp4")
+        == nested / "clip.mp4"
+    )
+    assert batch._output_path_for_file(
+        Path("nested/clip.dav"), Path("."), Path("out"), "mkv"
+    ) == Path("out/nested/clip.mkv")
 
 
 def test_convert_directory_aggregates_results(
@@ -106,6 +205,373 @@ def test_convert_directory_aggregates_results(
     assert convert_mock.call_count == 2
 
 
+def test_convert_directory_creates_output_dirs_up_front(
+    mocker: MagicMock,
+    tmp_path: Path,
+) -> None:
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    for name in ("a/one.dav", "a/two.dav", "b/three.dav"):
+        (input_dir / name).parent.mkdir(parents=True, exist_ok=True)
+        (input_dir / name).write_bytes(b"x")
+
+    converter = VideoConverter(logging.getLogger("test_batch_mkdir"))
+    convert_mock = mocker.patch.object(converter, "convert_video", return_value=True)
+
+    BatchConverter(converter, max_workers=1, prefetch_info=False).convert_directory(
+        input_dir, output_dir, recursive=True
+    )
+
+    assert (output_dir / "a").is_dir()
+    assert (output_dir / "b").is_dir()
+    assert all(
+        call.args[4].skip_mkdir and call.args[4].skip_input_check
+        for call in convert_mock.call_args_list
+    )
+
+
+def test_convert_directory_interrupt_cancels_queued_jobs(
+    mocker: MagicMock,
+    tmp_path: Path,
+) -> None:
+    for name in ("a.dav", "b.dav", "c.dav"):
+        (tmp_path / name).write_bytes(b"x")
+
+    converter = VideoConverter(logging.getLogger("test_batch_interrupt"))
+    started: list[Path] = []
+
+    def fake_convert(input_file: Path, *args: object) -> bool:
+        del args
+        started.append(input_file)
+        if len(started) == 1:
+            raise KeyboardInterrupt
+        time.sleep(0.2)
+        return True
+
+    convert_mock = mocker.patch.object(
+        converter, "convert_video", side_effect=fake_convert
+    )
+    terminate_mock = mocker.patch.object(
+        converter, "terminate_active_processes", return_value=0
+    )
+    batch = BatchConverter(converter, max_workers=1, prefetch_info=False)
+
+    with pytest.raises(KeyboardInterrupt):
+        batch.convert_directory(tmp_path)
+
+    terminate_mock.assert_called_once_with()
+    assert convert_mock.call_count < 3
+
+
+def test_convert_directory_prefetches_only_ffmpeg_jobs(
+    mocker: MagicMock,
+    tmp_path: Path,
+    sample_ffprobe_json: str,
+) -> None:
+    (tmp_path / "copy.mkv").write_bytes(b"matroska")
+    (tmp_path / "kept.dav").write_bytes(b"x")
+    (tmp_path / "kept.mkv").write_bytes(b"earlier output")
+    (tmp_path / "new.dav").write_bytes(b"x")
+    probe_mock = mocker.patch(
+        "dav2mkv.converter.subprocess.run",
+        return_value=subprocess.CompletedProcess(
+            args=["ffprobe"],
+            returncode=0,
+            stdout=sample_ffprobe_json.encode(),
+            stderr=b"",
+        ),
+    )
+    converter = VideoConverter(logging.getLogger("test_batch_prefetch_filter"))
+
+    def consume_prefetched_info(video_file: Path, *args: object) -> bool:
+        del args
+        converter._pop_cached_video_info(video_file)
+        return True
+
+    mocker.patch.object(converter, "convert_video", side_effect=consume_prefetched_info)
+    batch = BatchConverter(converter, max_workers=2)
+
+    batch.convert_directory(tmp_path, overwrite=False)
+
+    probed = [call.args[0][-1] for call in probe_mock.call_args_list]
+    assert probed == [str((tmp_path / "new.dav").resolve())]
+    assert not converter._info_cache
+
+
+class _BlockingFfmpeg:
+    """FFmpeg stand-in that runs until terminated, then exits on SIGTERM."""
+
+    def __init__(self, cmd: list[str], started: threading.Event) -> None:
+        self.args = cmd
+        self.pid = 4244
+        self.returncode: int | None = None
+        self.stdout = io.StringIO("")
+        self.stderr = io.StringIO("")
+        self._terminated = threading.Event()
+        started.set()
+
+    def __enter__(self) -> _BlockingFfmpeg:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def poll(self) -> int | None:
+        return self.returncode
+
+    def wait(self, timeout: float | None = None) -> int:
+        if not self._terminated.wait(timeout):
+            raise subprocess.TimeoutExpired(self.args, timeout or 0)
+        self.returncode = -15
+        return self.returncode
+
+    def terminate(self) -> None:
+        self._terminated.set()
+
+    def kill(self) -> None:
+        self._terminated.set()
+
+
+def test_convert_directory_interrupt_does_not_retry_terminated_ffmpeg(
+    mocker: MagicMock,
+    tmp_path: Path,
+    sample_ffprobe_json: str,
+) -> None:
+    for name in ("a.dav", "b.dav"):
+        (tmp_path / name).write_bytes(b"x")
+    # A clean start time plans a second, timestamp-regenerating attempt.
+    clean_report = sample_ffprobe_json.replace(
+        '"duration"', '"start_time": "0.000000", "duration"'
+    )
+    mocker.patch(
+        "dav2mkv.converter.subprocess.run",
+        return_value=subprocess.CompletedProcess(
+            args=["ffprobe"], returncode=0, stdout=clean_report.encode(), stderr=b""
+        ),
+    )
+    started = threading.Event()
+    launched: list[list[str]] = []
+
+    def fake_popen(cmd: list[str], **kwargs: object) -> _BlockingFfmpeg:
+        del kwargs
+        launched.append(cmd)
+        return _BlockingFfmpeg(cmd, started)
+
+    mocker.patch("dav2mkv.converter.subprocess.Popen", side_effect=fake_popen)
+
+    converter = VideoConverter(logging.getLogger("test_batch_interrupt_no_retry"))
+    convert_video = converter.convert_video
+
+    def convert_or_interrupt(
+        input_file: Path,
+        output_file: Path,
+        container: str,
+        overwrite: bool,
+        options: ConversionOptions,
+    ) -> bool:
+        if input_file.name == "a.dav":
+            assert started.wait(5)
+            raise KeyboardInterrupt
+        return convert_video(input_file, output_file, container, overwrite, options)
+
+    mocker.patch.object(converter, "convert_video", side_effect=convert_or_interrupt)
+    batch = BatchConverter(converter, max_workers=2)
+
+    with pytest.raises(KeyboardInterrupt):
+        batch.convert_directory(tmp_path)
+
+    assert len(launched) == 1
+    assert converter.get_stats()["conversions_failed"] == 1
+
+
+def test_convert_directory_pins_workers_to_disjoint_cpus(
+    mocker: MagicMock,
+    tmp_path: Path,
+) -> None:
+    for name in ("a.dav", "b.dav", "c.dav"):
+        (tmp_path / name).write_bytes(b"x")
+
+    converter = VideoConverter(logging.getLogger("test_batch_pinning"))
+    convert_mock = mocker.patch.object(converter, "convert_video", return_value=True)
+    batch = BatchConverter(
+        converter,
+        max_workers=2,
+        prefetch_info=False,
+        options=ConversionOptions(cpu_affinity=(0, 1, 2, 3)),
+    )
+
+    batch.convert_directory(tmp_path)
+
+    used = {call.args[4].cpu_affinity for call in convert_mock.call_args_list}
+    assert used <= {(0, 1), (2, 3)}
+    assert batch_module._partition_cpus((0, 1), 3) == [(0,), (1,), (0,)]
+
+
+def test_scan_skips_subdirectories_that_vanish_mid_walk(
+    mocker: MagicMock,
+    tmp_path: Path,
+) -> None:
+    (tmp_path / "top.dav").write_bytes(b"x")
+    (tmp_path / "gone").mkdir()
+    (tmp_path / "kept").mkdir()
+    (tmp_path / "kept" / "deep.dav").write_bytes(b"x")
+    batch = BatchConverter(VideoConverter(logging.getLogger("test_batch_vanish")))
+    scan_one_directory = batch._scan_one_directory
+
+    def scan_or_vanish(directory: str, recursive: bool) -> tuple[list[Path], list[str]]:
+        if Path(directory).name == "gone":
+            raise FileNotFoundError(directory)
+        return scan_one_directory(directory, recursive)
+
+    mocker.patch.object(batch, "_scan_one_directory", side_effect=scan_or_vanish)
+
+    async def collect() -> list[Path]:
+        return [path async for path in batch._iter_video_files_async(tmp_path, True)]
+
+    expected = [tmp_path / "kept" / "deep.dav", tmp_path / "top.dav"]
+    assert batch.find_video_files(tmp_path, recursive=True) == expected
+    assert sorted(asyncio.run(collect())) == expected
+
+
+def test_every_batch_entry_point_clears_an_earlier_cancellation(
+    mocker: MagicMock,
+    tmp_path: Path,
+) -> None:
+    (tmp_path / "a.dav").write_bytes(b"x")
+    converter = VideoConverter(logging.getLogger("test_batch_reset_cancel"))
+    mocker.patch.object(converter, "convert_video_async", return_value=True)
+    process_batch = BatchConverter(converter, use_processes=True)
+    mocker.patch.object(
+        process_batch,
+        "_run_in_processes",
+        return_value={"total": 1, "successful": 1, "failed": 0},
+    )
+    cancelled = converter._active_processes.cancelled
+
+    converter.terminate_active_processes()
+    process_batch.convert_directory(tmp_path)
+    assert not cancelled.is_set()
+
+    converter.terminate_active_processes()
+    asyncio.run(BatchConverter(converter).convert_directory_async(tmp_path))
+    assert not cancelled.is_set()
+
+
+def test_convert_directory_async_bounds_concurrency(
+    mocker: MagicMock,
+    tmp_path: Path,
+) -> None:
+    for name in ("a.dav", "b.dav", "c.dav", "d.dav"):
+        (tmp_path / name).write_bytes(b"x")
+
+    converter = VideoConverter(logging.getLogger("test_batch_async"))
+    running = 0
+    peak = 0
+
+    async def fake_convert(input_file: Path, *args: object) -> bool:
+        nonlocal running, peak
+        del args
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return input_file.name != "b.dav"
+
+    mocker.patch.object(converter, "convert_video_async", side_effect=fake_convert)
+    batch = BatchConverter(converter, max_workers=2)
+
+    results = asyncio.run(batch.convert_directory_async(tmp_path))
+
+    assert results == {"total": 4, "successful": 3, "failed": 1}
+    assert peak == 2
+
+
+def test_convert_directory_async_starts_converting_during_discovery(
+    mocker: MagicMock,
+    tmp_path: Path,
+) -> None:
+    (tmp_path / "top.dav").write_bytes(b"x")
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "deep.dav").write_bytes(b"x")
+
+    converter = VideoConverter(logging.getLogger("test_batch_pipeline"))
+    batch = BatchConverter(converter, max_workers=1)
+    first_converted = threading.Event()
+    overlapped: list[bool] = []
+    scan_subdirectory = batch._scan_subdirectory
+
+    def wait_then_scan(directory: str) -> tuple[list[Path], list[str]]:
+        overlapped.append(first_converted.wait(timeout=5))
+        return scan_subdirectory(directory)
+
+    async def fake_convert(*args: object) -> bool:
+        del args
+        first_converted.set()
+        return True
+
+    mocker.patch.object(batch, "_scan_subdirectory", side_effect=wait_then_scan)
+    mocker.patch.object(converter, "convert_video_async", side_effect=fake_convert)
+
+    results = asyncio.run(batch.convert_directory_async(tmp_path, recursive=True))
+
+    assert results == {"total": 2, "successful": 2, "failed": 0}
+    assert overlapped == [True]
+
+
+def test_convert_directory_async_failure_cancels_remaining_work(
+    mocker: MagicMock,
+    tmp_path: Path,
+) -> None:
+    for name in ("a.dav", "b.dav", "c.dav"):
+        (tmp_path / name).write_bytes(b"x")
+
+    converter = VideoConverter(logging.getLogger("test_batch_async_cancel"))
+    started: list[str] = []
+
+    async def fake_convert(input_file: Path, *args: object) -> bool:
+        del args
+        started.append(input_file.name)
+        if input_file.name == "a.dav":
+            raise RuntimeError("boom")
+        await asyncio.sleep(10)
+        return True
+
+    mocker.patch.object(converter, "convert_video_async", side_effect=fake_convert)
+    batch = BatchConverter(converter, max_workers=2)
+
+    with pytest.raises(ExceptionGroup):
+        asyncio.run(batch.convert_directory_async(tmp_path))
+
+    assert "c.dav" not in started
+
+
+def test_convert_directory_async_os_errors_do_not_stop_the_batch(
+    mocker: MagicMock,
+    tmp_path: Path,
+) -> None:
+    for name in ("a.dav", "b.dav", "c.dav"):
+        (tmp_path / name).write_bytes(b"x")
+    (tmp_path / "vanished").mkdir()
+
+    converter = VideoConverter(logging.getLogger("test_batch_async_os_errors"))
+    batch = BatchConverter(converter, max_workers=2)
+
+    async def fake_convert(input_file: Path, *args: object) -> bool:
+        del args
+        if input_file.name == "a.dav":
+            raise PermissionError("output is read-only")
+        return True
+
+    mocker.patch.object(converter, "convert_video_async", side_effect=fake_convert)
+    mocker.patch.object(
+        batch, "_scan_subdirectory", side_effect=FileNotFoundError("vanished")
+    )
+
+    results = asyncio.run(batch.convert_directory_async(tmp_path, recursive=True))
+
+    assert results == {"total": 3, "successful": 2, "failed": 1}
+
+
 def test_convert_directory_with_output_dir(
     mocker: MagicMock,
     tmp_path: Path,
@@ -135,6 +601,111 @@ def test_convert_directory_no_files(tmp_path: Path) -> None:
     converter = VideoConverter(logger)
     batch = BatchConverter(converter)
 
-    results = batch.convert_directory(input_dir=tmp_path)
+    results = batch.convert_directory(input_dir=tmp_path, output_dir=tmp_path / "out")
 
     assert results == {"total": 0, "successful": 0, "failed": 0}
+    assert not (tmp_path / "out").exists()
+
+
+def test_convert_directory_prefetches_video_info(
+    mocker: MagicMock,
+    tmp_path: Path,
+) -> None:
+    (tmp_path / "a.dav").write_bytes(b"a")
+
+    logger = logging.getLogger("test_batch_prefetch")
+    converter = VideoConverter(logger)
+    mocker.patch.object(converter, "convert_video", return_value=True)
+    prefetch_mock = mocker.patch.object(
+        converter, "prefetch_video_info", return_value=[]
+    )
+
+    BatchConverter(converter, max_workers=1).convert_directory(tmp_path)
+    prefetch_mock.assert_called_once_with([tmp_path / "a.dav"], mocker.ANY)
+
+    prefetch_mock.reset_mock()
+    BatchConverter(converter, max_workers=1, prefetch_info=False).convert_directory(
+        tmp_path
+    )
+    prefetch_mock.assert_not_called()
+
+
+def test_per_invocation_threads_split_cpus(mocker: MagicMock) -> None:
+    mocker.patch("dav2mkv.batch.available_cpus", return_value=16)
+    converter = VideoConverter(logging.getLogger("test_batch_threads"))
+
+    assert BatchConverter(converter, max_workers=4).per_invocation_threads == 4
+    assert BatchConverter(converter, max_workers=32).per_invocation_threads == 1
+    assert (
+        BatchConverter(
+            converter, max_workers=4, options=ConversionOptions(threads=2)
+        ).per_invocation_threads
+        == 2
+    )
+
+
+def test_available_cpus_prefers_affinity_mask(mocker: MagicMock) -> None:
+    mocker.patch("dav2mkv.batch.os.sched_getaffinity", return_value={0, 1}, create=True)
+    mocker.patch("dav2mkv.batch.os.cpu_count", return_value=64)
+
+    assert batch_module.available_cpus() == 2
+    converter = VideoConverter(logging.getLogger("test_batch_affinity"))
+    assert BatchConverter(converter).max_workers == 2
+
+
+def test_default_max_workers_capped_for_stream_copy(mocker: MagicMock) -> None:
+    mocker.patch("dav2mkv.batch.available_cpus", return_value=32)
+    converter = VideoConverter(logging.getLogger("test_batch_default_workers"))
+
+    batch = BatchConverter(converter)
+
+    assert batch.max_workers == 4
+    assert batch.per_invocation_threads == 8
+
+
+def test_worker_convert_reports_outcome(mocker: MagicMock, tmp_path: Path) -> None:
+    convert_mock = mocker.patch(
+        "dav2mkv.batch.VideoConverter.convert_video", return_value=True
+    )
+
+    options = ConversionOptions(threads=2)
+
+    success, elapsed = batch_module._worker_convert(
+        tmp_path / "a.dav", tmp_path / "a.mkv", "mkv", True, options
+    )
+
+    assert success is True
+    assert elapsed >= 0.0
+    convert_mock.assert_called_once_with(
+        tmp_path / "a.dav", tmp_path / "a.mkv", "mkv", True, options
+    )
+
+
+def test_convert_directory_with_processes_aggregates_stats(
+    mocker: MagicMock,
+    tmp_path: Path,
+) -> None:
+    (tmp_path / "a.dav").write_bytes(b"a")
+    (tmp_path / "b.dav").write_bytes(b"b")
+
+    def thread_pool(**kwargs: object) -> ThreadPoolExecutor:
+        initializer = kwargs["initializer"]
+        assert callable(initializer)
+        return ThreadPoolExecutor(max_workers=1)
+
+    mocker.patch("concurrent.futures.ProcessPoolExecutor", side_effect=thread_pool)
+    mocker.patch(
+        "dav2mkv.batch._worker_convert",
+        side_effect=[(True, 1.0), (False, 0.5)],
+    )
+
+    converter = VideoConverter(logging.getLogger("test_batch_processes"))
+    batch = BatchConverter(converter, max_workers=1, use_processes=True)
+
+    results = batch.convert_directory(tmp_path)
+
+    assert results == {"total": 2, "successful": 1, "failed": 1}
+    stats = converter.get_stats()
+    assert stats["conversions_attempted"] == 2
+    assert stats["conversions_successful"] == 1
+    assert stats["total_processing_time"] == 1.5
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -9,7 +10,14 @@ from unittest.mock import MagicMock
 import pytest
 
 from dav2mkv import __version__
-from dav2mkv.cli import create_argument_parser, main, resolve_input_arguments
+from dav2mkv.cli import (
+    _run_batch_mode,
+    create_argument_parser,
+    main,
+    resolve_input_arguments,
+)
+from dav2mkv.converter import VideoConverter
+from dav2mkv.probe import check_ffmpeg_availability
 
 
 def test_create_argument_parser_version_flag(
@@ -32,6 +40,95 @@ def test_resolve_input_arguments_file_flag() -> None:
     assert args.directory is None
 
 
+def test_resolve_input_arguments_no_prefetch_flag() -> None:
+    parser = create_argument_parser()
+    default_args = resolve_input_arguments(parser, parser.parse_args(["-d", "in"]))
+    namespace = parser.parse_args(["-d", "in", "--no-prefetch"])
+    args = resolve_input_arguments(parser, namespace)
+
+    assert default_args.processing.prefetch_info is True
+    assert args.processing.prefetch_info is False
+
+
+def test_resolve_input_arguments_force_remux_flag() -> None:
+    parser = create_argument_parser()
+    default_args = resolve_input_arguments(parser, parser.parse_args(["-f", "a.mkv"]))
+    namespace = parser.parse_args(["-f", "a.mkv", "--force-remux"])
+    args = resolve_input_arguments(parser, namespace)
+
+    assert default_args.processing.conversion.force_remux is False
+    assert args.processing.conversion.force_remux is True
+
+
+def test_resolve_input_arguments_skip_probe_flag() -> None:
+    parser = create_argument_parser()
+    namespace = parser.parse_args(["-d", "in", "--skip-probe"])
+    args = resolve_input_arguments(parser, namespace)
+
+    assert args.processing.conversion.skip_probe is True
+
+
+def test_resolve_input_arguments_processes_flag() -> None:
+    parser = create_argument_parser()
+    args = resolve_input_arguments(
+        parser, parser.parse_args(["-d", "in", "--processes"])
+    )
+
+    assert args.processing.use_processes is True
+    with pytest.raises(SystemExit):
+        parser.parse_args(["-d", "in", "--processes", "--async"])
+
+
+def test_run_batch_mode_async_flag_uses_event_loop(
+    mocker: MagicMock, tmp_path: Path
+) -> None:
+    parser = create_argument_parser()
+    namespace = parser.parse_args(["-d", str(tmp_path), "--async"])
+    cli_args = resolve_input_arguments(parser, namespace)
+    sync_mock = mocker.patch("dav2mkv.cli.BatchConverter.convert_directory")
+    async_mock = mocker.patch(
+        "dav2mkv.cli.BatchConverter.convert_directory_async",
+        new_callable=mocker.AsyncMock,
+        return_value={"total": 1, "successful": 1, "failed": 0},
+    )
+    converter = VideoConverter(logging.getLogger("test_cli_async"))
+
+    assert _run_batch_mode(converter, cli_args) == 0
+    async_mock.assert_awaited_once()
+    sync_mock.assert_not_called()
+
+
+def test_ffmpeg_threads_per_invocation_validation() -> None:
+    parser = create_argument_parser()
+    namespace = parser.parse_args(
+        ["-f", "in.dav", "--ffmpeg-threads-per-invocation", "8"]
+    )
+    args = resolve_input_arguments(parser, namespace)
+
+    assert args.processing.conversion.threads == 8
+    short = parser.parse_args(["-f", "in.dav", "--ffmpeg-threads", "3"])
+    assert resolve_input_arguments(parser, short).processing.conversion.threads == 3
+    for bad_value in ("0", "65", "many"):
+        with pytest.raises(SystemExit):
+            parser.parse_args(
+                ["-f", "in.dav", "--ffmpeg-threads-per-invocation", bad_value]
+            )
+
+
+def test_resolve_input_arguments_repeated_container() -> None:
+    parser = create_argument_parser()
+    namespace = parser.parse_args(
+        ["-f", "in.dav", "--container", "mp4", "--container", "mkv"]
+    )
+    args = resolve_input_arguments(parser, namespace)
+    default_args = resolve_input_arguments(parser, parser.parse_args(["-f", "in.dav"]))
+
+    assert args.container == "mp4"
+    assert args.processing.conversion.extra_containers == ("mkv",)
+    assert default_args.container == "mkv"
+    assert default_args.processing.conversion.extra_containers == ()
+
+
 def test_resolve_input_arguments_positional_file(tmp_path: Path) -> None:
     input_file = tmp_path / "input.dav"
     input_file.write_bytes(b"data")
@@ -232,8 +329,6 @@ def test_main_batch_mode_all_failed(mocker: MagicMock, tmp_path: Path) -> None:
 
 
 def test_check_ffmpeg_availability_success(mocker: MagicMock) -> None:
-    from dav2mkv.probe import check_ffmpeg_availability
-
     mocker.patch(
         "dav2mkv.probe.subprocess.run",
         side_effect=[
@@ -259,8 +354,6 @@ def test_check_ffmpeg_availability_success(mocker: MagicMock) -> None:
 
 
 def test_check_ffmpeg_availability_not_found(mocker: MagicMock) -> None:
-    from dav2mkv.probe import check_ffmpeg_availability
-
     mocker.patch(
         "dav2mkv.probe.subprocess.run",
         side_effect=FileNotFoundError,
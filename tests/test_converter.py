@@ -2,29 +2,143 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
 import logging
 import subprocess
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
-from dav2mkv.converter import VideoConverter
+from dav2mkv.converter import VideoConverter, _ProgressWatchdog
+from dav2mkv.exceptions import VideoProcessingError
+from dav2mkv.types import ConversionOptions
 
 
 def _completed_process(
     returncode: int = 0,
-    stdout: str = "",
-    stderr: str = "",
-) -> subprocess.CompletedProcess[str]:
+    stdout: bytes = b"",
+    stderr: bytes = b"",
+) -> subprocess.CompletedProcess[bytes]:
     return subprocess.CompletedProcess(
-        args=["ffmpeg"],
+        args=["ffprobe"],
         returncode=returncode,
         stdout=stdout,
         stderr=stderr,
     )
 
 
+class _FakePopen:
+    """Stand-in for the FFmpeg subprocess.Popen handle."""
+
+    def __init__(
+        self,
+        cmd: list[str],
+        returncode: int = 0,
+        stderr: str = "",
+        hang: bool = False,
+    ) -> None:
+        self.args = cmd
+        self.pid = 4242
+        self.returncode = returncode
+        progress = "" if hang else "out_time=00:00:01.000000\nprogress=end\n"
+        self.stdout = io.StringIO(progress)
+        self.stderr = io.StringIO(stderr)
+        self.hang = hang
+        self.killed = False
+
+    def __enter__(self) -> _FakePopen:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stdout.close()
+        self.stderr.close()
+
+    def wait(self, timeout: float | None = None) -> int:
+        if self.hang and not self.killed:
+            raise subprocess.TimeoutExpired(self.args, timeout or 0)
+        return self.returncode
+
+    def kill(self) -> None:
+        self.killed = True
+
+
+def _patch_ffmpeg(
+    mocker: MagicMock,
+    on_run: Callable[[list[str]], object] | None = None,
+    returncode: int = 0,
+    stderr: str = "",
+    hang: bool = False,
+) -> list[_FakePopen]:
+    """Patch FFmpeg launches and return the list of fake processes started."""
+    launched: list[_FakePopen] = []
+
+    def fake_popen(cmd: list[str], **kwargs: object) -> _FakePopen:
+        del kwargs
+        if on_run is not None:
+            on_run(cmd)
+        process = _FakePopen(cmd, returncode, stderr, hang)
+        launched.append(process)
+        return process
+
+    mocker.patch("dav2mkv.converter.subprocess.Popen", side_effect=fake_popen)
+    return launched
+
+
+class _FakeAsyncProcess:
+    """Stand-in for an asyncio subprocess handle."""
+
+    def __init__(self, stdout: bytes, returncode: int = 0) -> None:
+        self.stdout = asyncio.StreamReader()
+        self.stdout.feed_data(stdout)
+        self.stdout.feed_eof()
+        self.stderr = asyncio.StreamReader()
+        self.stderr.feed_eof()
+        self.pid = 4243
+        self.returncode: int | None = None
+        self._exit_code = returncode
+
+    async def communicate(self) -> tuple[bytes, bytes]:
+        return await self.stdout.read(), await self.stderr.read()
+
+    async def wait(self) -> int:
+        self.returncode = self._exit_code
+        return self._exit_code
+
+    def kill(self) -> None:
+        self.returncode = -9
+
+
+def _patch_async_subprocesses(
+    mocker: MagicMock, ffprobe_stdout: str, source: Path
+) -> list[list[str]]:
+    """Patch asyncio subprocess launches; fake FFmpeg copies the source file."""
+    launched: list[list[str]] = []
+
+    async def fake_exec(*cmd: str, **kwargs: object) -> _FakeAsyncProcess:
+        del kwargs
+        launched.append(list(cmd))
+        if cmd[0] == "ffprobe":
+            return _FakeAsyncProcess(ffprobe_stdout.encode())
+        Path(cmd[-1]).write_bytes(source.read_bytes())
+        return _FakeAsyncProcess(b"out_time=00:00:01.000000\nprogress=end\n")
+
+    mocker.patch("asyncio.create_subprocess_exec", side_effect=fake_exec)
+    return launched
+
+
+def _patch_ffprobe(mocker: MagicMock, stdout: str) -> MagicMock:
+    """Patch ffprobe to return the given JSON report."""
+    return mocker.patch(
+        "dav2mkv.converter.subprocess.run",
+        return_value=_completed_process(stdout=stdout.encode()),
+    )
+
+
 def test_convert_video_success(
     mocker: MagicMock,
     temp_video_file: Path,
@@ -34,22 +148,11 @@ def test_convert_video_success(
     output_file = tmp_path / "output.mkv"
     logger = logging.getLogger("test_converter_success")
 
-    def fake_run(
-        cmd: list[str],
-        capture_output: bool = True,
-        text: bool = True,
-        timeout: float | None = None,
-        check: bool = False,
-    ) -> subprocess.CompletedProcess[str]:
-        del capture_output, text, timeout, check
-        if cmd[0] == "ffprobe":
-            return _completed_process(stdout=sample_ffprobe_json)
-        if cmd[0] == "ffmpeg":
-            output_file.write_bytes(temp_video_file.read_bytes())
-            return _completed_process()
-        raise AssertionError(f"Unexpected command: {cmd}")
-
-    mocker.patch("dav2mkv.converter.subprocess.run", side_effect=fake_run)
+    _patch_ffprobe(mocker, sample_ffprobe_json)
+    _patch_ffmpeg(
+        mocker,
+        on_run=lambda cmd: output_file.write_bytes(temp_video_file.read_bytes()),
+    )
 
     converter = VideoConverter(logger)
     success = converter.convert_video(
@@ -75,21 +178,9 @@ def test_convert_video_ffmpeg_failure(
     output_file = tmp_path / "output.mkv"
     logger = logging.getLogger("test_converter_ffmpeg_fail")
 
-    def fake_run(
-        cmd: list[str],
-        capture_output: bool = True,
-        text: bool = True,
-        timeout: float | None = None,
-        check: bool = False,
-    ) -> subprocess.CompletedProcess[str]:
-        del capture_output, text, timeout, check
-        if cmd[0] == "ffprobe":
-            return _completed_process(stdout=sample_ffprobe_json)
-        if cmd[0] == "ffmpeg":
-            return _completed_process(returncode=1, stderr="conversion failed")
-        raise AssertionError(f"Unexpected command: {cmd}")
-
-    mocker.patch("dav2mkv.converter.subprocess.run", side_effect=fake_run)
+    _patch_ffprobe(mocker, sample_ffprobe_json)
+    _patch_ffmpeg(mocker, returncode=1, stderr="conversion failed\n")
+    error_mock = mocker.patch.object(logger, "error")
 
     converter = VideoConverter(logger)
     success = converter.convert_video(
@@ -102,6 +193,91 @@ def test_convert_video_ffmpeg_failure(
     assert not output_file.exists()
     stats = converter.get_stats()
     assert stats["conversions_failed"] == 1
+    error_mock.assert_any_call(
+        "FFmpeg conversion failed (code %s): %s", 1, "conversion failed"
+    )
+
+
+def test_convert_video_ffmpeg_stall_kills_process(
+    mocker: MagicMock,
+    temp_video_file: Path,
+    sample_ffprobe_json: str,
+    tmp_path: Path,
+) -> None:
+    logger = logging.getLogger("test_converter_ffmpeg_timeout")
+
+    _patch_ffprobe(mocker, sample_ffprobe_json)
+    mocker.patch("dav2mkv.converter._FFMPEG_STALL_TIMEOUT", 0.0)
+    launched = _patch_ffmpeg(mocker, hang=True)
+
+    converter = VideoConverter(logger)
+    success = converter.convert_video(temp_video_file, tmp_path / "output.mkv")
+
+    assert success is False
+    assert launched[0].killed is True
+
+
+def test_progress_watchdog_ticks_only_when_out_time_advances(
+    mocker: MagicMock,
+) -> None:
+    clock = mocker.patch("dav2mkv.converter.time.monotonic", return_value=10.0)
+    watchdog = _ProgressWatchdog()
+
+    clock.return_value = 20.0
+    watchdog.drain(io.StringIO("out_time=00:00:01.000000\nprogress=continue\n"))
+    clock.return_value = 50.0
+    watchdog.drain(io.StringIO("out_time=00:00:01.000000\nprogress=continue\n"))
+
+    assert watchdog.last_out_time == "out_time=00:00:01.000000"
+    assert watchdog.stalled_for() == 30.0
+
+
+class _SilentTrailerPopen(_FakePopen):
+    """FFmpeg that stops reporting progress while it keeps writing its output."""
+
+    def __init__(self, cmd: list[str], clock: list[float], output_file: Path) -> None:
+        super().__init__(cmd)
+        self.clock = clock
+        self.output_file = output_file
+        self.silent_polls = 6
+
+    def wait(self, timeout: float | None = None) -> int:
+        if not self.silent_polls:
+            return self.returncode
+        self.silent_polls -= 1
+        self.clock[0] += 10.0
+        with self.output_file.open("ab") as output:
+            output.write(b"moov")
+        raise subprocess.TimeoutExpired(self.args, timeout or 0)
+
+
+def test_convert_video_output_writes_count_as_progress(
+    mocker: MagicMock,
+    temp_video_file: Path,
+    sample_ffprobe_json: str,
+    tmp_path: Path,
+) -> None:
+    output_file = tmp_path / "output.mp4"
+    output_file.write_bytes(temp_video_file.read_bytes())
+    clock = [0.0]
+    mocker.patch("dav2mkv.converter.time.monotonic", side_effect=lambda: clock[0])
+    mocker.patch("dav2mkv.converter._FFMPEG_STALL_TIMEOUT", 20.0)
+    _patch_ffprobe(mocker, sample_ffprobe_json)
+    launched: list[_SilentTrailerPopen] = []
+
+    def fake_popen(cmd: list[str], **kwargs: object) -> _SilentTrailerPopen:
+        del kwargs
+        launched.append(_SilentTrailerPopen(cmd, clock, output_file))
+        return launched[-1]
+
+    mocker.patch("dav2mkv.converter.subprocess.Popen", side_effect=fake_popen)
+
+    converter = VideoConverter(logging.getLogger("test_converter_silent_trailer"))
+    success = converter.convert_video(temp_video_file, output_file, "mp4")
+
+    assert success is True
+    assert launched[0].killed is False
+    assert launched[0].silent_polls == 0
 
 
 def test_convert_video_no_overwrite_existing_output(
@@ -114,6 +290,7 @@ def test_convert_video_no_overwrite_existing_output(
     logger = logging.getLogger("test_converter_no_overwrite")
 
     run_mock = mocker.patch("dav2mkv.converter.subprocess.run")
+    launched = _patch_ffmpeg(mocker)
 
     converter = VideoConverter(logger)
     success = converter.convert_video(
@@ -125,6 +302,7 @@ def test_convert_video_no_overwrite_existing_output(
 
     assert success is False
     run_mock.assert_not_called()
+    assert not launched
 
 
 def test_convert_video_empty_output_file(
@@ -136,22 +314,8 @@ def test_convert_video_empty_output_file(
     output_file = tmp_path / "output.mkv"
     logger = logging.getLogger("test_converter_empty_output")
 
-    def fake_run(
-        cmd: list[str],
-        capture_output: bool = True,
-        text: bool = True,
-        timeout: float | None = None,
-        check: bool = False,
-    ) -> subprocess.CompletedProcess[str]:
-        del capture_output, text, timeout, check
-        if cmd[0] == "ffprobe":
-            return _completed_process(stdout=sample_ffprobe_json)
-        if cmd[0] == "ffmpeg":
-            output_file.write_bytes(b"")
-            return _completed_process()
-        raise AssertionError(f"Unexpected command: {cmd}")
-
-    mocker.patch("dav2mkv.converter.subprocess.run", side_effect=fake_run)
+    _patch_ffprobe(mocker, sample_ffprobe_json)
+    _patch_ffmpeg(mocker, on_run=lambda cmd: output_file.write_bytes(b""))
 
     converter = VideoConverter(logger)
     success = converter.convert_video(
@@ -163,6 +327,25 @@ def test_convert_video_empty_output_file(
     assert success is False
 
 
+def test_convert_video_missing_output_file(
+    mocker: MagicMock,
+    temp_video_file: Path,
+    sample_ffprobe_json: str,
+    tmp_path: Path,
+) -> None:
+    logger = logging.getLogger("test_converter_missing_output")
+
+    _patch_ffprobe(mocker, sample_ffprobe_json)
+    _patch_ffmpeg(mocker)
+    error_mock = mocker.patch.object(logger, "error")
+
+    converter = VideoConverter(logger)
+    output_file = tmp_path / "output.mkv"
+
+    assert converter.convert_video(temp_video_file, output_file) is False
+    error_mock.assert_any_call("Output file does not exist: %s", output_file)
+
+
 def test_convert_video_ffprobe_timeout(
     mocker: MagicMock,
     temp_video_file: Path,
@@ -175,6 +358,8 @@ def test_convert_video_ffprobe_timeout(
         "dav2mkv.converter.subprocess.run",
         side_effect=subprocess.TimeoutExpired(cmd=["ffprobe"], timeout=30),
     )
+    mocker.patch("dav2mkv.converter._FFMPEG_STALL_TIMEOUT", 0.0)
+    _patch_ffmpeg(mocker, hang=True)
 
     converter = VideoConverter(logger)
     success = converter.convert_video(
@@ -193,7 +378,7 @@ def test_get_video_info_ffprobe_failure(
     logger = logging.getLogger("test_get_video_info_ffprobe_fail")
     mocker.patch(
         "dav2mkv.converter.subprocess.run",
-        return_value=_completed_process(returncode=1, stderr="probe failed"),
+        return_value=_completed_process(returncode=1, stderr=b"probe failed"),
     )
 
     converter = VideoConverter(logger)
@@ -212,6 +397,53 @@ def test_convert_video_missing_input(tmp_path: Path) -> None:
     assert stats["conversions_failed"] == 1
 
 
+def test_convert_video_skip_input_check(
+    mocker: MagicMock,
+    temp_video_file: Path,
+    sample_ffprobe_json: str,
+    tmp_path: Path,
+) -> None:
+    output_file = tmp_path / "output.mkv"
+    _patch_ffprobe(mocker, sample_ffprobe_json)
+    _patch_ffmpeg(
+        mocker,
+        on_run=lambda cmd: output_file.write_bytes(temp_video_file.read_bytes()),
+    )
+    validate_spy = mocker.spy(VideoConverter, "_validate_conversion_input")
+
+    converter = VideoConverter(logging.getLogger("test_converter_skip_check"))
+    success = converter.convert_video(
+        temp_video_file,
+        output_file,
+        options=ConversionOptions(skip_input_check=True),
+    )
+
+    assert success is True
+    validate_spy.assert_not_called()
+
+
+def test_convert_video_skip_probe(
+    mocker: MagicMock,
+    temp_video_file: Path,
+    tmp_path: Path,
+) -> None:
+    output_file = tmp_path / "output.mkv"
+    run_mock = mocker.patch("dav2mkv.converter.subprocess.run")
+    launched = _patch_ffmpeg(
+        mocker,
+        on_run=lambda cmd: output_file.write_bytes(temp_video_file.read_bytes()),
+    )
+
+    converter = VideoConverter(logging.getLogger("test_converter_skip_probe"))
+    success = converter.convert_video(
+        temp_video_file, output_file, options=ConversionOptions(skip_probe=True)
+    )
+
+    assert success is True
+    run_mock.assert_not_called()
+    assert "+genpts" in launched[0].args
+
+
 def test_convert_video_unsupported_container(temp_video_file: Path) -> None:
     logger = logging.getLogger("test_converter_bad_container")
     converter = VideoConverter(logger)
@@ -224,9 +456,434 @@ def test_convert_video_unsupported_container(temp_video_file: Path) -> None:
     assert success is False
 
 
+def test_get_stats_counts_under_lock() -> None:
+    converter = VideoConverter(logging.getLogger("test_converter_stats_threads"))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for index in range(100):
+            executor.submit(converter.record_conversion, index % 4 != 0, 0.5)
+    converter.record_conversion(True, 1.0)
+
+    stats = converter.get_stats()
+    assert stats["conversions_attempted"] == 101
+    assert stats["conversions_successful"] == 76
+    assert stats["conversions_failed"] == 25
+    assert stats["total_processing_time"] == 51.0
+
+
+def test_get_video_info_requests_only_used_fields(
+    mocker: MagicMock,
+    temp_video_file: Path,
+    sample_ffprobe_json: str,
+) -> None:
+    probe_mock = _patch_ffprobe(mocker, sample_ffprobe_json)
+    converter = VideoConverter(logging.getLogger("test_get_video_info_entries"))
+
+    video_info = converter.get_video_info(temp_video_file)
+
+    cmd = probe_mock.call_args.args[0]
+    assert "-show_streams" not in cmd
+    entries = cmd[cmd.index("-show_entries") + 1]
+    assert "stream=codec_type," in entries
+    assert entries.endswith(":format=duration,size,start_time")
+    assert video_info is not None
+    assert video_info.stream_counts["video"] == 1
+
+
 def test_get_video_info_missing_file(tmp_path: Path) -> None:
     logger = logging.getLogger("test_get_video_info_missing")
     converter = VideoConverter(logger)
     missing = tmp_path / "missing.dav"
 
     assert converter.get_video_info(missing) is None
+
+
+def test_get_video_info_batch_reused_by_convert_video(
+    mocker: MagicMock,
+    temp_video_file: Path,
+    sample_ffprobe_json: str,
+    tmp_path: Path,
+) -> None:
+    output_file = tmp_path / "output.mkv"
+    logger = logging.getLogger("test_converter_prefetch")
+
+    probe_mock = _patch_ffprobe(mocker, sample_ffprobe_json)
+    launched = _patch_ffmpeg(
+        mocker,
+        on_run=lambda cmd: output_file.write_bytes(temp_video_file.read_bytes()),
+    )
+
+    converter = VideoConverter(logger)
+    probed = converter.get_video_info_batch([temp_video_file], max_workers=2)
+
+    assert list(probed) == [temp_video_file.resolve()]
+    assert converter.convert_video(temp_video_file, output_file) is True
+    assert probe_mock.call_count == 1
+    assert len(launched) == 1
+
+
+def test_convert_video_waits_for_pending_prefetch(
+    mocker: MagicMock,
+    temp_video_file: Path,
+    sample_ffprobe_json: str,
+    tmp_path: Path,
+) -> None:
+    output_file = tmp_path / "output.mkv"
+    probe_mock = _patch_ffprobe(mocker, sample_ffprobe_json)
+    _patch_ffmpeg(
+        mocker,
+        on_run=lambda cmd: output_file.write_bytes(temp_video_file.read_bytes()),
+    )
+    converter = VideoConverter(logging.getLogger("test_converter_pending_probe"))
+    release = threading.Event()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(release.wait)
+        converter.prefetch_video_info([temp_video_file], executor)
+        with ThreadPoolExecutor(max_workers=1) as convert_pool:
+            converted = convert_pool.submit(
+                converter.convert_video, temp_video_file, output_file
+            )
+            assert not converted.done()
+            assert probe_mock.call_count == 0
+            release.set()
+            assert converted.result(timeout=5) is True
+
+    assert probe_mock.call_count == 1
+    assert not converter._info_cache
+
+
+def test_build_ffmpeg_cmd_threads(tmp_path: Path) -> None:
+    converter = VideoConverter(logging.getLogger("test_converter_threads"))
+    input_file = tmp_path / "in.dav"
+    output_file = tmp_path / "out.mkv"
+
+    outputs = [(output_file, "mkv")]
+    default_cmd = converter._build_ffmpeg_cmd(input_file, outputs, True)
+    threaded_cmd = converter._build_ffmpeg_cmd(input_file, outputs, True, 4)
+
+    assert "-threads" not in default_cmd
+    assert default_cmd[1:5] == ["-hide_banner", "-nostdin", "-loglevel", "error"]
+    assert threaded_cmd[5:7] == ["-threads", "4"]
+    assert threaded_cmd.count("-threads") == 2
+
+
+def test_build_ffmpeg_cmd_multiple_outputs(tmp_path: Path) -> None:
+    converter = VideoConverter(logging.getLogger("test_converter_multi_output"))
+    outputs = [(tmp_path / "out.mkv", "mkv"), (tmp_path / "a|b.mp4", "mp4")]
+
+    cmd = converter._build_ffmpeg_cmd(tmp_path / "in.dav", outputs, True)
+
+    assert cmd.count("-i") == 1
+    assert cmd[-22:] == [
+        "-map",
+        "0",
+        "-c",
+        "copy",
+        "-avoid_negative_ts",
+        "make_zero",
+        "-cluster_time_limit",
+        "1000",
+        "-f",
+        "matroska",
+        str(tmp_path / "out.mkv"),
+        "-map",
+        "0",
+        "-c",
+        "copy",
+        "-avoid_negative_ts",
+        "make_zero",
+        "-movflags",
+        "+faststart",
+        "-f",
+        "mp4",
+        str(tmp_path / "a|b.mp4"),
+    ]
+
+
+def test_convert_video_extra_containers_single_run(
+    mocker: MagicMock,
+    temp_video_file: Path,
+    sample_ffprobe_json: str,
+    tmp_path: Path,
+) -> None:
+    output_file = tmp_path / "output.mkv"
+    logger = logging.getLogger("test_converter_extra_containers")
+
+    def write_outputs(cmd: list[str]) -> None:
+        del cmd
+        for suffix in (".mkv", ".mp4"):
+            output_file.with_suffix(suffix).write_bytes(temp_video_file.read_bytes())
+
+    _patch_ffprobe(mocker, sample_ffprobe_json)
+    launched = _patch_ffmpeg(mocker, on_run=write_outputs)
+
+    converter = VideoConverter(logger)
+    success = converter.convert_video(
+        temp_video_file,
+        output_file,
+        "mkv",
+        options=ConversionOptions(extra_containers=("mp4", "mkv")),
+    )
+
+    assert success is True
+    assert len(launched) == 1
+    assert launched[0].args.count("-map") == 2
+
+
+def test_plan_outputs_rejects_containers_sharing_a_path(
+    mocker: MagicMock, tmp_path: Path
+) -> None:
+    launched = _patch_ffmpeg(mocker)
+    converter = VideoConverter(logging.getLogger("test_converter_collision"))
+    options = ConversionOptions(extra_containers=("mp4",), skip_input_check=True)
+
+    with pytest.raises(VideoProcessingError, match="Several containers"):
+        converter._plan_outputs(Path("in.dav"), "out.mp4", "mkv", options)
+
+    input_file = tmp_path / "in.dav"
+    input_file.write_bytes(b"x")
+    assert not converter.convert_video(
+        input_file, tmp_path / "out.mp4", "mkv", True, options
+    )
+    assert not launched
+
+
+def test_convert_video_in_place_extra_container_skips_input(
+    mocker: MagicMock,
+    sample_ffprobe_json: str,
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    input_file = tmp_path / "clip.mkv"
+    input_file.write_bytes(b"matroska data")
+    _patch_ffprobe(mocker, sample_ffprobe_json)
+    launched = _patch_ffmpeg(
+        mocker,
+        on_run=lambda cmd: (tmp_path / "clip.mp4").write_bytes(b"matroska data"),
+    )
+    converter = VideoConverter(logging.getLogger("test_converter_in_place_extra"))
+    options = ConversionOptions(extra_containers=("mp4",))
+
+    with caplog.at_level(logging.INFO, logger="test_converter_in_place_extra"):
+        assert converter.will_run_ffmpeg(input_file, None, "mkv", options=options)
+        assert not caplog.messages
+        success = converter.convert_video(input_file, None, "mkv", options=options)
+
+    assert success is True
+    reused = [message for message in caplog.messages if "Input is already" in message]
+    assert reused == [
+        f"Input is already MKV, writing only the other containers: {input_file}"
+    ]
+    assert launched[0].args.count(str(input_file)) == 1
+    assert launched[0].args[-1] == str(tmp_path / "clip.mp4")
+    assert input_file.read_bytes() == b"matroska data"
+
+
+def test_convert_video_same_container_links_without_ffmpeg(
+    mocker: MagicMock, tmp_path: Path
+) -> None:
+    input_file = tmp_path / "clip.MKV"
+    input_file.write_bytes(b"matroska data")
+    output_file = tmp_path / "out" / "clip.mkv"
+    run_mock = mocker.patch("dav2mkv.converter.subprocess.run")
+    launched = _patch_ffmpeg(mocker)
+
+    converter = VideoConverter(logging.getLogger("test_converter_same_container"))
+
+    assert converter.convert_video(input_file, output_file, "mkv") is True
+    assert output_file.read_bytes() == b"matroska data"
+    assert converter.convert_video(input_file, input_file, "mkv") is True
+    run_mock.assert_not_called()
+    assert not launched
+    assert converter.get_stats()["conversions_successful"] == 2
+
+
+def test_convert_video_records_monotonic_processing_time(
+    mocker: MagicMock, tmp_path: Path
+) -> None:
+    input_file = tmp_path / "clip.mkv"
+    input_file.write_bytes(b"matroska data")
+    mocker.patch("dav2mkv.converter.time.monotonic", side_effect=[100.0, 100.25])
+    converter = VideoConverter(logging.getLogger("test_converter_timing"))
+
+    assert converter.convert_video(input_file, tmp_path / "out.mkv", "mkv") is True
+    assert converter.get_stats()["total_processing_time"] == pytest.approx(0.25)
+
+
+def test_convert_video_force_remux_runs_ffmpeg(
+    mocker: MagicMock,
+    sample_ffprobe_json: str,
+    tmp_path: Path,
+) -> None:
+    input_file = tmp_path / "clip.mkv"
+    input_file.write_bytes(b"matroska data")
+    output_file = tmp_path / "remuxed.mkv"
+    _patch_ffprobe(mocker, sample_ffprobe_json)
+    launched = _patch_ffmpeg(
+        mocker, on_run=lambda cmd: output_file.write_bytes(b"matroska data")
+    )
+
+    converter = VideoConverter(logging.getLogger("test_converter_force_remux"))
+    success = converter.convert_video(
+        input_file,
+        output_file,
+        "mkv",
+        options=ConversionOptions(force_remux=True),
+    )
+
+    assert success is True
+    assert len(launched) == 1
+
+
+def test_convert_video_clean_timestamps_skip_genpts_then_retry(
+    mocker: MagicMock,
+    temp_video_file: Path,
+    sample_ffprobe_json: str,
+    tmp_path: Path,
+) -> None:
+    output_file = tmp_path / "output.mkv"
+    clean_report = sample_ffprobe_json.replace(
+        '"duration"', '"start_time": "0.000000", "duration"'
+    )
+
+    def write_when_regenerating(cmd: list[str]) -> None:
+        if "+genpts" in cmd:
+            output_file.write_bytes(temp_video_file.read_bytes())
+
+    _patch_ffprobe(mocker, clean_report)
+    launched = _patch_ffmpeg(mocker, on_run=write_when_regenerating)
+
+    converter = VideoConverter(logging.getLogger("test_converter_genpts_retry"))
+
+    assert converter.convert_video(temp_video_file, output_file, overwrite=False)
+    assert len(launched) == 2
+    assert "-avoid_negative_ts" not in launched[0].args
+    assert launched[1].args[5:8] == ["-fflags", "+genpts", "-i"]
+    assert "-y" in launched[1].args
+
+
+def test_convert_video_async_success(
+    mocker: MagicMock,
+    temp_video_file: Path,
+    sample_ffprobe_json: str,
+    tmp_path: Path,
+) -> None:
+    output_file = tmp_path / "output.mkv"
+    launched = _patch_async_subprocesses(mocker, sample_ffprobe_json, temp_video_file)
+    popen_mock = mocker.patch("dav2mkv.converter.subprocess.Popen")
+
+    converter = VideoConverter(logging.getLogger("test_converter_async"))
+    success = asyncio.run(converter.convert_video_async(temp_video_file, output_file))
+
+    assert success is True
+    assert output_file.read_bytes() == temp_video_file.read_bytes()
+    assert [cmd[0] for cmd in launched] == ["ffprobe", "ffmpeg"]
+    popen_mock.assert_not_called()
+    assert converter.get_stats()["conversions_successful"] == 1
+
+
+def test_run_ffmpeg_conversion_pins_thread_only_while_spawning(
+    mocker: MagicMock,
+) -> None:
+    mocker.patch("dav2mkv.affinity.sys.platform", "linux")
+    mocker.patch(
+        "dav2mkv.affinity.os.sched_getaffinity", return_value={0, 1, 2, 3}, create=True
+    )
+    setaffinity = mocker.patch("dav2mkv.affinity.os.sched_setaffinity", create=True)
+    masks_at_spawn: list[object] = []
+    _patch_ffmpeg(
+        mocker, on_run=lambda cmd: masks_at_spawn.append(setaffinity.call_args)
+    )
+    converter = VideoConverter(logging.getLogger("test_pin_cpus"))
+
+    converter._run_ffmpeg_conversion(["ffmpeg"])
+    setaffinity.assert_not_called()
+
+    converter._run_ffmpeg_conversion(["ffmpeg"], cpu_affinity=(2, 3))
+    assert masks_at_spawn == [None, mocker.call(0, (2, 3))]
+    assert setaffinity.call_args_list == [
+        mocker.call(0, (2, 3)),
+        mocker.call(0, {0, 1, 2, 3}),
+    ]
+
+
+def test_run_ffmpeg_conversion_async_restores_loop_thread_mask(
+    mocker: MagicMock,
+) -> None:
+    mask = {0, 1, 2, 3, 4, 5, 6, 7}
+    masks_at_spawn: list[set[int]] = []
+
+    def set_mask(pid: int, cpus: Iterable[int]) -> None:
+        del pid
+        mask.clear()
+        mask.update(cpus)
+
+    async def fake_exec(*cmd: str, **kwargs: object) -> _FakeAsyncProcess:
+        del cmd, kwargs
+        masks_at_spawn.append(set(mask))
+        await asyncio.sleep(0)
+        return _FakeAsyncProcess(b"progress=end\n")
+
+    mocker.patch("dav2mkv.affinity.sys.platform", "linux")
+    mocker.patch(
+        "dav2mkv.affinity.os.sched_getaffinity",
+        side_effect=lambda pid: set(mask),
+        create=True,
+    )
+    mocker.patch(
+        "dav2mkv.affinity.os.sched_setaffinity", side_effect=set_mask, create=True
+    )
+    mocker.patch("asyncio.create_subprocess_exec", side_effect=fake_exec)
+    converter = VideoConverter(logging.getLogger("test_pin_cpus_async"))
+
+    async def convert_all() -> None:
+        await asyncio.gather(
+            *(
+                converter._run_ffmpeg_conversion_async(
+                    ["ffmpeg"], cpu_affinity=(2 * worker, 2 * worker + 1)
+                )
+                for worker in range(4)
+            )
+        )
+
+    asyncio.run(convert_all())
+
+    assert sorted(map(sorted, masks_at_spawn)) == [[0, 1], [2, 3], [4, 5], [6, 7]]
+    assert mask == {0, 1, 2, 3, 4, 5, 6, 7}
+
+
+def test_convert_video_rejects_missing_and_non_file_inputs(tmp_path: Path) -> None:
+    converter = VideoConverter(logging.getLogger("test_validate_input"))
+
+    assert not converter.convert_video(tmp_path / "missing.dav")
+    assert not converter.convert_video(tmp_path)
+
+
+def test_terminate_active_processes_stops_running_ffmpeg() -> None:
+    converter = VideoConverter(logging.getLogger("test_terminate"))
+    running = MagicMock()
+    running.poll.return_value = None
+    finished = MagicMock()
+    finished.poll.return_value = 0
+    converter._active_processes.add(running)
+    converter._active_processes.add(finished)
+
+    assert converter.terminate_active_processes() == 1
+    running.terminate.assert_called_once_with()
+    finished.terminate.assert_not_called()
+
+
+def test_ffmpeg_stderr_is_logged_as_it_arrives_at_debug(
+    mocker: MagicMock, caplog: pytest.LogCaptureFixture
+) -> None:
+    _patch_ffmpeg(mocker, stderr="first warning\nsecond warning\n")
+    logger = logging.getLogger("test_stderr_debug")
+    converter = VideoConverter(logger)
+
+    with caplog.at_level(logging.DEBUG, logger="test_stderr_debug"):
+        result = converter._run_ffmpeg_conversion(["ffmpeg"])
+
+    assert result.stderr == "first warning\nsecond warning"
+    assert "FFmpeg: first warning" in caplog.messages
+    assert "FFmpeg: second warning" in caplog.messages
@@ -3,23 +3,40 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
+from collections.abc import Iterator
+from logging.handlers import QueueHandler
 from pathlib import Path
 from unittest.mock import MagicMock
 
-from dav2mkv.log_config import setup_logging
+import pytest
+
+from dav2mkv.log_config import (
+    forward_worker_logs,
+    setup_logging,
+    setup_worker_logging,
+    stop_queued_logging,
+)
 
 
 def _reset_dav2mkv_logger() -> None:
+    stop_queued_logging()
     logger = logging.getLogger("dav2mkv")
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
         handler.close()
-    logger.setLevel(logging.WARNING)
+    logger.setLevel(logging.NOTSET)
 
 
-def test_setup_logging_console_only() -> None:
+@pytest.fixture(autouse=True)
+def _fresh_dav2mkv_logger() -> Iterator[None]:
+    """Start each test unconfigured and leave no handlers for later tests."""
+    _reset_dav2mkv_logger()
+    yield
     _reset_dav2mkv_logger()
 
+
+def test_setup_logging_console_only() -> None:
     logger = setup_logging("DEBUG")
     assert logger.name == "dav2mkv"
     assert logger.level == logging.DEBUG
@@ -29,7 +46,6 @@ def test_setup_logging_console_only() -> None:
 
 
 def test_setup_logging_with_file(tmp_path: Path) -> None:
-    _reset_dav2mkv_logger()
     log_file = tmp_path / "logs" / "conversion.log"
     logger = setup_logging("INFO", str(log_file))
 
@@ -39,7 +55,6 @@ def test_setup_logging_with_file(tmp_path: Path) -> None:
 
 
 def test_setup_logging_returns_existing_logger(tmp_path: Path) -> None:
-    _reset_dav2mkv_logger()
     first = setup_logging("INFO")
     second = setup_logging("DEBUG", str(tmp_path / "ignored.log"))
     assert first is second
@@ -50,7 +65,6 @@ def test_setup_logging_file_handler_failure(
     mocker: MagicMock,
     tmp_path: Path,
 ) -> None:
-    _reset_dav2mkv_logger()
     mocker.patch("dav2mkv.log_config.os.makedirs", side_effect=OSError("denied"))
 
     logger = setup_logging("INFO", str(tmp_path / "logs" / "conversion.log"))
@@ -59,3 +73,35 @@ def test_setup_logging_file_handler_failure(
     assert any(
         isinstance(handler, logging.StreamHandler) for handler in logger.handlers
     )
+
+
+def test_setup_logging_queued_writes_through_listener(tmp_path: Path) -> None:
+    log_file = tmp_path / "queued.log"
+
+    logger = setup_logging("INFO", str(log_file), queued=True)
+    logger.info("queued message")
+    stop_queued_logging()
+
+    assert [type(handler) for handler in logger.handlers] == [QueueHandler]
+    assert "queued message" in log_file.read_text(encoding="utf-8")
+
+
+def test_worker_log_records_reach_parent_log_file(tmp_path: Path) -> None:
+    records: multiprocessing.Queue[logging.LogRecord] = multiprocessing.get_context(
+        "spawn"
+    ).Queue()
+    worker_logger = setup_worker_logging("DEBUG", records)
+    worker_logger.debug("FFmpeg: %s", "bad packet")
+    record = records.get(timeout=5)
+
+    assert [type(handler) for handler in worker_logger.handlers] == [QueueHandler]
+    assert record.getMessage() == "FFmpeg: bad packet"
+
+    _reset_dav2mkv_logger()
+    log_file = tmp_path / "batch.log"
+    setup_logging("DEBUG", str(log_file))
+    listener = forward_worker_logs(records)
+    records.put(record)
+    listener.stop()
+
+    assert "FFmpeg: bad packet" in log_file.read_text(encoding="utf-8")
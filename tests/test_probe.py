@@ -7,7 +7,14 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from dav2mkv.probe import VideoInfo, parse_ffprobe_report
+from dav2mkv.probe import (
+    VideoInfo,
+    check_ffmpeg_availability,
+    clear_ffmpeg_availability_cache,
+    get_int_field,
+    get_str_field,
+    parse_ffprobe_report,
+)
 
 
 def test_parse_ffprobe_report_valid(sample_ffprobe_json: str) -> None:
@@ -22,6 +29,13 @@ def test_parse_ffprobe_report_invalid_json() -> None:
     assert parse_ffprobe_report("not json") is None
 
 
+def test_parse_ffprobe_report_accepts_bytes(sample_ffprobe_json: str) -> None:
+    report = parse_ffprobe_report(sample_ffprobe_json.encode())
+
+    assert report == parse_ffprobe_report(sample_ffprobe_json)
+    assert parse_ffprobe_report(b"\xff not json") is None
+
+
 def test_parse_ffprobe_report_invalid_streams_type() -> None:
     assert parse_ffprobe_report('{"streams": "bad", "format": {}}') is None
 
@@ -53,24 +67,18 @@ def test_video_info_primary_streams(sample_ffprobe_json: str) -> None:
 
 
 def test_get_str_field_non_string_value() -> None:
-    from dav2mkv.probe import get_str_field
-
     assert get_str_field({"key": 42}, "key") == "42"
     assert get_str_field({}, "missing") == "unknown"
     assert get_str_field({"key": None}, "key") == "unknown"
 
 
 def test_get_int_field_defaults() -> None:
-    from dav2mkv.probe import get_int_field
-
     assert get_int_field({"width": 1280}, "width") == 1280
     assert get_int_field({}, "width") == "?"
     assert get_int_field({"width": "bad"}, "width") == "bad"
 
 
 def test_check_ffmpeg_ffprobe_missing(mocker: MagicMock) -> None:
-    from dav2mkv.probe import check_ffmpeg_availability
-
     mocker.patch(
         "dav2mkv.probe.subprocess.run",
         side_effect=[
@@ -94,6 +102,51 @@ def test_check_ffmpeg_ffprobe_missing(mocker: MagicMock) -> None:
     assert version is None
 
 
+def test_check_ffmpeg_availability_caches_success(mocker: MagicMock) -> None:
+    run_mock = mocker.patch(
+        "dav2mkv.probe.subprocess.run",
+        return_value=subprocess.CompletedProcess(
+            args=["ffmpeg", "-version"],
+            returncode=0,
+            stdout="ffmpeg version 6.0\n",
+            stderr="",
+        ),
+    )
+
+    assert check_ffmpeg_availability() == (True, "ffmpeg version 6.0")
+    assert check_ffmpeg_availability() == (True, "ffmpeg version 6.0")
+    assert run_mock.call_count == 2
+
+    clear_ffmpeg_availability_cache()
+    check_ffmpeg_availability()
+    assert run_mock.call_count == 4
+
+
+def test_check_ffmpeg_availability_rechecks_when_path_changes(
+    mocker: MagicMock,
+) -> None:
+    run_mock = mocker.patch(
+        "dav2mkv.probe.subprocess.run",
+        return_value=subprocess.CompletedProcess(
+            args=["ffmpeg", "-version"],
+            returncode=0,
+            stdout="ffmpeg version 6.0\n",
+            stderr="",
+        ),
+    )
+    which_mock = mocker.patch(
+        "dav2mkv.probe.shutil.which", side_effect=lambda name: f"/usr/bin/{name}"
+    )
+
+    check_ffmpeg_availability()
+    check_ffmpeg_availability()
+    assert run_mock.call_count == 2
+
+    which_mock.side_effect = lambda name: f"/opt/ffmpeg/bin/{name}"
+    check_ffmpeg_availability()
+    assert run_mock.call_count == 4
+
+
 def test_video_info_unknown_stream_type() -> None:
     report = parse_ffprobe_report(
         '{"streams": [{"codec_type": "attachment"}], "format": {}}'
@@ -109,3 +162,24 @@ def test_video_info_empty_streams() -> None:
     info = VideoInfo(report)
     assert info.get_primary_video_info() == {}
     assert info.get_primary_audio_info() == {}
+
+
+def test_video_info_has_non_negative_start_time() -> None:
+    def info(format_json: str) -> VideoInfo:
+        report = parse_ffprobe_report(f'{{"streams": [], "format": {format_json}}}')
+        assert report is not None
+        return VideoInfo(report)
+
+    assert info('{"start_time": "0.000000"}').has_non_negative_start_time()
+    assert not info('{"start_time": "-0.080000"}').has_non_negative_start_time()
+    assert not info('{"start_time": "N/A"}').has_non_negative_start_time()
+    assert not info("{}").has_non_negative_start_time()
+
+
+def test_video_info_uses_slots(sample_ffprobe_json: str) -> None:
+    report = parse_ffprobe_report(sample_ffprobe_json)
+    assert report is not None
+    info = VideoInfo(report)
+
+    assert not hasattr(info, "__dict__")
+    assert info.format_info == report["format"]
@@ -32,7 +32,7 @@ class TestVersion:
     def test_fallback_reads_pyproject(self, mocker: MockerFixture) -> None:
         """Test fallback parses pyproject.toml when metadata is missing."""
         mocker.patch(
-            "dav2mkv._version.version",
+            "importlib.metadata.version",
             side_effect=PackageNotFoundError("dav2mkv"),
         )
         clear_fallback_version_cache()